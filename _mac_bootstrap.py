@@ -0,0 +1,47 @@
+"""macOS-only startup helpers for ReGenesis.
+
+Only imported by main.py on darwin, so Foundation/AppKit are never loaded on
+other platforms. Each helper imports PyObjC locally and silently does nothing
+when it isn't available.
+"""
+import os
+from functools import lru_cache
+
+
+def set_bundle_name(name):
+    """Set the process name shown in the macOS menu bar.
+
+    Must run before tkinter initializes, otherwise the menu keeps 'Python'.
+    """
+    try:
+        from Foundation import NSBundle
+        bundle = NSBundle.mainBundle()
+        if bundle:
+            info = bundle.localizedInfoDictionary() or bundle.infoDictionary()
+            if info:
+                info['CFBundleName'] = name
+    except ImportError:
+        # Foundation module not available, menu will show 'Python'
+        pass
+
+
+@lru_cache(maxsize=None)
+def _load_nsimage(icon_path):
+    """Decode an image file into an NSImage once per process (None if missing)."""
+    from Foundation import NSImage
+
+    if not os.path.exists(icon_path):
+        return None
+    return NSImage.alloc().initWithContentsOfFile_(icon_path)
+
+
+def set_dock_icon(icon_path):
+    """Set the dock icon. Must run after tkinter has initialized NSApp."""
+    try:
+        import AppKit
+
+        image = _load_nsimage(icon_path)
+        if image and AppKit.NSApp:
+            AppKit.NSApp.setApplicationIconImage_(image)
+    except (ImportError, AttributeError):
+        pass
@@ -1,39 +1,28 @@
+import gc
+import os
 import sys
 from regenesis_gui import RegenesisGUI
 
 
 def main():
     """Entry point for the Regenesis application."""
-    # Set process name for macOS menu bar
     if sys.platform == 'darwin':
-        try:
-            from Foundation import NSBundle
-            bundle = NSBundle.mainBundle()
-            if bundle:
-                info = bundle.localizedInfoDictionary() or bundle.infoDictionary()
-                if info:
-                    info['CFBundleName'] = 'ReGenesis'
-        except ImportError:
-            # Foundation module not available, menu will show 'Python'
-            pass
+        import _mac_bootstrap
+        # Set process name for macOS menu bar (must happen before Tk starts)
+        _mac_bootstrap.set_bundle_name('ReGenesis')
 
     # Create GUI (which will set the icon)
     gui = RegenesisGUI()
 
-    # Set dock icon after tkinter is initialized
+    # Set dock icon once the event loop is idle so decoding it doesn't delay first paint
     if sys.platform == 'darwin':
-        try:
-            from Foundation import NSImage
-            import AppKit
-            import os
-
-            icon_path = os.path.join(os.path.dirname(__file__), 'oak_leaf.icns')
-            if os.path.exists(icon_path):
-                image = NSImage.alloc().initWithContentsOfFile_(icon_path)
-                if image and AppKit.NSApp:
-                    AppKit.NSApp.setApplicationIconImage_(image)
-        except (ImportError, AttributeError):
-            pass
+        icon_path = os.path.join(os.path.dirname(__file__), 'oak_leaf.icns')
+        gui.root.after_idle(_mac_bootstrap.set_dock_icon, icon_path)
+
+    # The plant database and widgets built during startup live for the whole
+    # session; once they exist, move them out of the tracked generations so
+    # GC passes skip them
+    gui.when_started(gc.freeze)
 
     gui.run()
 
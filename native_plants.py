@@ -27,6 +27,9 @@ class PlantContainer:
         """Return all plants in the container."""
         return self.plants
 
+    def __iter__(self):
+        return iter(self.plants)
+
     def __len__(self):
         return len(self.plants)
 
@@ -34,30 +37,31 @@ class PlantContainer:
         return f"PlantContainer with {len(self.plants)} plants"
 
 
+# Native plants with their characteristic colors
+_PLANTS_DATA = (
+    ("Purple Coneflower", "purple"),
+    ("Black-Eyed Susan", "yellow"),
+    ("Wild Bergamot", "pink"),
+    ("Butterfly Weed", "orange"),
+    ("New England Aster", "purple"),
+    ("Joe Pye Weed", "purple"),
+    ("Wild Columbine", "red"),
+    ("Goldenrod", "yellow"),
+    ("Blazing Star", "purple"),
+)
+
+# Possible heights
+_HEIGHTS = (1, 2, 3, 4)
+
+
 # Create the container and populate with 9 native plants
 def create_plant_database():
     """Create and populate a database of 9 native plants with specific colors and random heights."""
     container = PlantContainer()
 
-    # Native plants with their characteristic colors
-    plants_data = [
-        ("Purple Coneflower", "purple"),
-        ("Black-Eyed Susan", "yellow"),
-        ("Wild Bergamot", "pink"),
-        ("Butterfly Weed", "orange"),
-        ("New England Aster", "purple"),
-        ("Joe Pye Weed", "purple"),
-        ("Wild Columbine", "red"),
-        ("Goldenrod", "yellow"),
-        ("Blazing Star", "purple")
-    ]
-
-    # Possible heights
-    heights = [1, 2, 3, 4]
-
     # Add plants with random heights but specific colors
-    for name, color in plants_data:
-        height = random.choice(heights)
+    random_heights = random.choices(_HEIGHTS, k=len(_PLANTS_DATA))
+    for (name, color), height in zip(_PLANTS_DATA, random_heights):
         container.add_plant(name, height, color)
 
     return container
@@ -70,5 +74,5 @@ if __name__ == "__main__":
     print(f"{db}\n")
     print("Plant Database:")
     print("-" * 50)
-    for plant in db.get_all_plants():
+    for plant in db:
         print(f"  {plant.name:25} | {plant.height}ft | {plant.color}")
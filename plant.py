@@ -1,17 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Plant:
-    """Represents a single native plant with height and color attributes."""
+    """Represents a single native plant with height and color attributes.
 
-    def __init__(self, name, height, color):
-        self.name = name
-        self.height = height  # in feet
-        self.color = color
+    Instances are immutable and hashable, so equal plants can be deduplicated
+    with a set or used as dict keys.
+    """
+
+    name: str
+    height: int  # in feet
+    color: str
 
     def __repr__(self):
         return f"Plant('{self.name}', {self.height}ft, '{self.color}')"
-
-    def __eq__(self, other):
-        if not isinstance(other, Plant):
-            return False
-        return (self.name == other.name and
-                self.height == other.height and
-                self.color == other.color)
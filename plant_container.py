@@ -1,24 +1,162 @@
+from array import array
+from functools import lru_cache
+from itertools import compress
+
 from plant import Plant
 
 
+@lru_cache(maxsize=64)
+def _height_mask_table(lo, hi):
+    """Return a bytes.translate table mapping a height byte to 1 if lo <= height <= hi."""
+    # Heights are stored as signed chars, so bytes 128-255 are the negative values
+    return bytes(lo <= (b if b < 128 else b - 256) <= hi for b in range(256))
+
+
+@lru_cache(maxsize=None)
+def _code_mask_table(code):
+    """Return a bytes.translate table mapping a color code byte to 1 if it equals code."""
+    return bytes(b == code for b in range(256))
+
+
+def _height_value(height):
+    """Return height as an int that fits the signed-char height column.
+
+    Whole-number floats (e.g. 3.0) are accepted; anything else raises ValueError.
+    """
+    if isinstance(height, float) and height.is_integer():
+        height = int(height)
+    if not isinstance(height, int) or not -128 <= height <= 127:
+        raise ValueError(f"Plant height must be a whole number of feet from -128 to 127, got {height!r}")
+    return height
+
+
+# Colors of the native plant palette. Each container starts from these codes
+# and appends any other color it sees, up to 256 distinct colors.
+_PALETTE = ("white", "yellow", "purple", "pink", "orange", "red")
+
+# Most filter results a container keeps for its current contents
+_QUERY_CACHE_SIZE = 64
+
+
 class PlantContainer:
-    """Container class for managing a collection of native plants."""
+    """Container class for managing a collection of native plants.
+
+    Plant attributes are stored column-wise (names, heights, color codes) so
+    that filters scan one flat byte array instead of dereferencing every Plant
+    object. Colors are stored as indexes into the container's palette.
+    Plant instances are only materialized when get_all_plants() is called.
+    """
 
     def __init__(self):
-        self.plants = []
+        self.names = []
+        self.heights = array('b')  # in whole feet
+        self.color_codes = array('B')  # Indexes into self.palette
+        self.palette = list(_PALETTE)
+        self._palette_index = {color: code for code, color in enumerate(self.palette)}
+        self._plants = None  # Materialized Plant list, built on demand
+        self.version = 0  # Bumped on every change so cached query results can be keyed on it
+        self._query_cache = {}  # (query, args) -> tuple of Plants, valid for _query_version
+        self._query_version = 0
 
     def add_plant(self, name, height, color):
         """Add a plant to the container."""
+        # Validate before touching any column so they always stay aligned
+        height = _height_value(height)
+        code = self._color_code(color)
+        self.heights.append(height)
+        self.color_codes.append(code)
+        self.names.append(name)
+        self.version += 1
         plant = Plant(name, height, color)
-        self.plants.append(plant)
+        if self._plants is not None:
+            self._plants.append(plant)
         return plant
 
+    def add_plants(self, plants):
+        """Add existing Plant objects in bulk.
+
+        Plants are immutable, so the given objects are shared rather than copied.
+        """
+        plants = list(plants)
+        was_empty = not self.names
+        # Build the new column values first, so a bad plant raises before any
+        # column has grown and the columns always stay aligned
+        heights = array('b', [_height_value(plant.height) for plant in plants])
+        codes = array('B', [self._color_code(plant.color) for plant in plants])
+        self.heights.extend(heights)
+        self.color_codes.extend(codes)
+        self.names.extend(plant.name for plant in plants)
+        self.version += 1
+        if was_empty:
+            self._plants = plants
+        elif self._plants is not None:
+            self._plants.extend(plants)
+
+    def _color_code(self, color):
+        """Return the palette code for a color, adding it to the palette if new."""
+        code = self._palette_index.get(color)
+        if code is None:
+            code = len(self.palette)
+            if code > 255:
+                raise ValueError("A container holds at most 256 distinct colors")
+            self.palette.append(color)
+            self._palette_index[color] = code
+        return code
+
     def get_all_plants(self):
         """Return all plants in the container."""
-        return self.plants
+        if self._plants is None:
+            colors = map(self.palette.__getitem__, self.color_codes)
+            self._plants = [Plant(name, height, color)
+                            for name, height, color in zip(self.names, self.heights, colors)]
+        return self._plants
+
+    def indices_by_height(self, min_height=None, max_height=None):
+        """Return indices of plants within a height range (a falsy bound is open)."""
+        # Open bounds fall back to the limits of the signed-char height array
+        lo = min_height if min_height else -128
+        hi = max_height if max_height else 127
+        # translate() turns the whole height buffer into a 0/1 mask in one C call,
+        # and compress() picks the matching indices without a Python-level loop
+        mask = self.heights.tobytes().translate(_height_mask_table(lo, hi))
+        return list(compress(range(len(self.heights)), mask))
+
+    def indices_by_color(self, color):
+        """Return indices of plants with the given color."""
+        code = self._palette_index.get(color)
+        if code is None:
+            return []
+        mask = self.color_codes.tobytes().translate(_code_mask_table(code))
+        return list(compress(range(len(self.color_codes)), mask))
+
+    def _cached_query(self, key, find_indices, *args):
+        """Return the plants at find_indices(*args), cached until the container changes."""
+        if self._query_version != self.version:
+            self._query_cache.clear()
+            self._query_version = self.version
+        result = self._query_cache.get(key)
+        if result is None:
+            if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+                self._query_cache.clear()
+            plants = self.get_all_plants()
+            result = tuple(map(plants.__getitem__, find_indices(*args)))
+            self._query_cache[key] = result
+        return result
+
+    def plants_by_height(self, min_height=None, max_height=None):
+        """Return a tuple of plants within a height range (a falsy bound is open)."""
+        return self._cached_query(('height', min_height, max_height),
+                                  self.indices_by_height, min_height, max_height)
+
+    def plants_by_color(self, color):
+        """Return a tuple of plants with the given color."""
+        return self._cached_query(('color', color), self.indices_by_color, color)
+
+    def __iter__(self):
+        return iter(self.get_all_plants())
 
     def __len__(self):
-        return len(self.plants)
+        return len(self.names)
 
     def __repr__(self):
-        return f"PlantContainer with {len(self.plants)} plants"
+        return f"PlantContainer with {len(self)} plants"
@@ -1,16 +1,64 @@
 """Preferences manager for ReGenesis application."""
-import json
+import atexit
 import os
-from pathlib import Path
+import weakref
+
+# Managers still in use, flushed once at interpreter exit. Held weakly so the
+# exit hook neither keeps dropped managers alive nor lets one of them write
+# stale preferences over a newer save.
+_live_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers():
+    """Write pending changes of every manager still in use."""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+def _split_key(key):
+    """Split a dotted preference key into its parts."""
+    return tuple(key.split('.'))
+
+
+def _flatten(prefs, prefix=''):
+    """Flatten a nested preferences dict into {"section.key": value} form."""
+    flat = {}
+    for key, value in prefs.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _nest(flat):
+    """Rebuild the nested on-disk structure from flattened preferences."""
+    nested = {}
+    for key, value in flat.items():
+        *sections, leaf = _split_key(key)
+        target = nested
+        for section in sections:
+            target = target.setdefault(section, {})
+        target[leaf] = value
+    return nested
 
 
 class PreferencesManager:
-    """Manages application preferences stored in ~/.regenesis/preferences.json"""
+    """Manages application preferences stored in ~/.regenesis/preferences.json
+
+    Preferences are held in memory as a flat {"section.key": value} dict and
+    only nested again when written to disk. Changes made with set() are written
+    by flush(), which also runs automatically at interpreter exit for managers
+    that are still in use.
+    """
 
     def __init__(self):
-        self.prefs_dir = Path.home() / '.regenesis'
-        self.prefs_file = self.prefs_dir / 'preferences.json'
-        self.preferences = self._load_preferences()
+        self.prefs_dir = os.path.join(os.path.expanduser('~'), '.regenesis')
+        self.prefs_file = os.path.join(self.prefs_dir, 'preferences.json')
+        self._flat = self._load_preferences()
+        self._dirty = False
+        _live_managers.add(self)
 
     def _get_default_preferences(self):
         """Return default preferences structure."""
@@ -24,13 +72,14 @@ class PreferencesManager:
         }
 
     def _load_preferences(self):
-        """Load preferences from file, create if doesn't exist."""
+        """Load flattened preferences from file, create if doesn't exist."""
+        import json
+
         # Create directory if it doesn't exist
-        if not self.prefs_dir.exists():
-            self.prefs_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(self.prefs_dir, exist_ok=True)
 
         # Load or create preferences file
-        if self.prefs_file.exists():
+        if os.path.exists(self.prefs_file):
             try:
                 with open(self.prefs_file, 'r') as f:
                     prefs = json.load(f)
@@ -39,59 +88,71 @@ class PreferencesManager:
                 return self._merge_preferences(defaults, prefs)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading preferences: {e}")
-                return self._get_default_preferences()
+                return _flatten(self._get_default_preferences())
         else:
             # Create default preferences file
             defaults = self._get_default_preferences()
             self._save_preferences(defaults)
-            return defaults
+            return _flatten(defaults)
 
     def _merge_preferences(self, defaults, loaded):
-        """Merge loaded preferences with defaults to ensure all keys exist."""
-        result = defaults.copy()
-        for key, value in loaded.items():
+        """Merge loaded preferences with defaults to ensure all keys exist.
+
+        Returns the flattened result. Loaded keys are kept if they exist in the
+        defaults or belong to one of the default sections (e.g. "location").
+        A loaded value whose shape clashes with the defaults (a plain value
+        where the defaults have a section, or a section where they have a
+        value) is dropped, so the result can always be nested again.
+        """
+        result = _flatten(defaults)
+        # Every section path in the defaults, e.g. "location"
+        sections = {'.'.join(parts[:depth]) for parts in map(_split_key, result)
+                    for depth in range(1, len(parts))}
+        for key, value in _flatten(loaded).items():
             if key in result:
-                if isinstance(value, dict) and isinstance(result[key], dict):
-                    result[key].update(value)
-                else:
-                    result[key] = value
+                result[key] = value
+                continue
+            parts = _split_key(key)
+            if parts[0] not in sections or key in sections:
+                continue
+            if any('.'.join(parts[:depth]) in result for depth in range(1, len(parts))):
+                continue
+            result[key] = value
         return result
 
     def _save_preferences(self, prefs):
-        """Save preferences to file."""
+        """Save nested preferences to file as compact JSON."""
+        try:
+            import orjson
+            data = orjson.dumps(prefs)
+        except ImportError:
+            import json
+            data = json.dumps(prefs, separators=(',', ':')).encode()
+
+        # Write to a temp file and swap it in so a crash never leaves a partial file
+        tmp_file = f"{self.prefs_file}.tmp"
         try:
-            with open(self.prefs_file, 'w') as f:
-                json.dump(prefs, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.prefs_file)
         except IOError as e:
             print(f"Error saving preferences: {e}")
 
+    def flush(self):
+        """Write pending preference changes to disk."""
+        if self._dirty:
+            self._save_preferences(_nest(self._flat))
+            self._dirty = False
+
     def get(self, key, default=None):
-        """Get a preference value."""
-        keys = key.split('.')
-        value = self.preferences
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        """Get a preference value by its full dotted key."""
+        value = self._flat.get(key)
         return value if value is not None else default
 
     def set(self, key, value):
-        """Set a preference value."""
-        keys = key.split('.')
-        prefs = self.preferences
-
-        # Navigate to the correct nested location
-        for k in keys[:-1]:
-            if k not in prefs:
-                prefs[k] = {}
-            prefs = prefs[k]
-
-        # Set the value
-        prefs[keys[-1]] = value
-
-        # Save to file
-        self._save_preferences(self.preferences)
+        """Set a preference value; it is written to disk on the next flush()."""
+        self._flat[key] = value
+        self._dirty = True
 
     def get_location(self):
         """Get location coordinates as tuple (latitude, longitude)."""
@@ -1,7 +1,54 @@
 import random
 import json
+from collections import Counter
+from functools import cache
+from plant import Plant
 from plant_container import PlantContainer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Common native plant names
+_PLANT_NAMES = (
+    "Purple Coneflower",
+    "Black-Eyed Susan",
+    "Wild Bergamot",
+    "Butterfly Weed",
+    "New England Aster",
+    "Joe Pye Weed",
+    "Wild Columbine",
+    "Goldenrod",
+    "Blazing Star",
+)
+
+# Possible attributes
+_HEIGHTS = (1, 2, 3, 4)
+_COLORS = ("white", "yellow", "purple", "pink")
+
+
+@cache
+def _default_plants(seed=None):
+    """Return the sample plant database as a tuple of Plants.
+
+    Attributes are drawn once per seed and the result is shared by every
+    Regenesis instance; Plants are immutable, so sharing them is safe.
+    """
+    rng = random if seed is None else random.Random(seed)
+    count = len(_PLANT_NAMES)
+    heights = rng.choices(_HEIGHTS, k=count)
+    colors = rng.choices(_COLORS, k=count)
+    return tuple(Plant(name, height, color)
+                 for name, height, color in zip(_PLANT_NAMES, heights, colors))
+
+
+def dumps_json(data):
+    """Serialize data to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 class Regenesis:
     """Core application class for managing native plant selection and plot design."""
@@ -15,28 +62,7 @@ class Regenesis:
 
     def _initialize_plant_database(self):
         """Initialize the plant database with sample native plants."""
-        # Common native plant names
-        plant_names = [
-            "Purple Coneflower",
-            "Black-Eyed Susan",
-            "Wild Bergamot",
-            "Butterfly Weed",
-            "New England Aster",
-            "Joe Pye Weed",
-            "Wild Columbine",
-            "Goldenrod",
-            "Blazing Star"
-        ]
-
-        # Possible attributes
-        heights = [1, 2, 3, 4]
-        colors = ["white", "yellow", "purple", "pink"]
-
-        # Add 9 plants with random attributes
-        for name in plant_names:
-            height = random.choice(heights)
-            color = random.choice(colors)
-            self.plant_container.add_plant(name, height, color)
+        self.plant_container.add_plants(_default_plants())
 
     def set_plot_dimensions(self, width, height):
         """Set the dimensions of the plot in feet."""
@@ -49,19 +75,11 @@ class Regenesis:
 
     def filter_plants_by_height(self, min_height=None, max_height=None):
         """Filter plants by height range."""
-        plants = self.get_all_plants()
-        filtered = []
-        for plant in plants:
-            if min_height and plant.height < min_height:
-                continue
-            if max_height and plant.height > max_height:
-                continue
-            filtered.append(plant)
-        return filtered
+        return list(self.plant_container.plants_by_height(min_height, max_height))
 
     def filter_plants_by_color(self, color):
         """Filter plants by color."""
-        return [p for p in self.get_all_plants() if p.color == color]
+        return list(self.plant_container.plants_by_color(color))
 
     def add_plant_to_selection(self, plant):
         """Add a plant to the current selection."""
@@ -73,10 +91,7 @@ class Regenesis:
 
     def get_color_distribution(self):
         """Get the distribution of colors in selected plants."""
-        color_counts = {}
-        for plant in self.selected_plants:
-            color_counts[plant.color] = color_counts.get(plant.color, 0) + 1
-        return color_counts
+        return dict(Counter(plant.color for plant in self.selected_plants))
 
     def save_to_file(self, filepath):
         """Save the current project to a JSON file."""
@@ -95,8 +110,8 @@ class Regenesis:
             ]
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(project_data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dumps_json(project_data))
 
     def load_from_file(self, filepath):
         """Load a project from a JSON file."""
@@ -108,16 +123,17 @@ class Regenesis:
         self.plot_width = dims.get("width")
         self.plot_height = dims.get("height")
 
+        # Index the database once so each saved plant is an O(1) lookup
+        index = {}
+        for plant in self.plant_container:
+            index.setdefault((plant.name, plant.height, plant.color), plant)
+
         # Restore selected plants
         self.selected_plants = []
         for plant_data in project_data.get("selected_plants", []):
-            # Find matching plant in database
-            for plant in self.get_all_plants():
-                if (plant.name == plant_data["name"] and
-                    plant.height == plant_data["height"] and
-                    plant.color == plant_data["color"]):
-                    self.selected_plants.append(plant)
-                    break
+            plant = index.get((plant_data["name"], plant_data["height"], plant_data["color"]))
+            if plant is not None:
+                self.selected_plants.append(plant)
 
     def new_project(self):
         """Start a new project by clearing current selections."""
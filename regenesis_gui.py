@@ -1,70 +1,158 @@
-import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
-from tkinter import filedialog, messagebox
-import tkinter as tk
 import os
-from regenesis import Regenesis
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from preferences_manager import PreferencesManager
 
+# Shortest time the splash stays up, so a fast launch doesn't just flash it.
+# A slow launch closes it as soon as startup is done.
+SPLASH_MIN_VISIBLE = 0.4  # seconds
+
+# Tree drag feedback is recomputed at most once per frame (~60 Hz)
+DRAG_MOTION_INTERVAL_MS = 16
+
+# ttkbootstrap themes offered in Preferences, in display order, with descriptions
+THEMES = (
+    ("flatly", "Modern & Clean (Default)"),
+    ("litera", "Nature-Friendly Earth Tones"),
+    ("minty", "Fresh Green"),
+    ("cosmo", "Clean & Bright"),
+    ("yeti", "Soft & Modern"),
+    ("journal", "Classic & Professional"),
+    ("sandstone", "Warm & Natural"),
+    ("darkly", "Dark Mode"),
+    ("superhero", "Dark Blue"),
+    ("solar", "Dark with High Contrast"),
+)
+
+# Resolved once at import; icons and main.py live next to this module
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_PATH = os.path.join(SCRIPT_DIR, 'oak_leaf_icon_512.png')
+
+# tkinter and ttkbootstrap are bound on first RegenesisGUI construction so that
+# importing this module (from main.py or the test suites) doesn't pay for Tk.
+tk = None
+ttk = None
+filedialog = None
+messagebox = None
+
+
+def _load_tk():
+    """Import tkinter and ttkbootstrap into the module namespace on first use."""
+    global tk, ttk, filedialog, messagebox
+    if tk is not None:
+        return
+    import tkinter
+    import ttkbootstrap
+    from tkinter import filedialog as tk_filedialog, messagebox as tk_messagebox
+    tk = tkinter
+    ttk = ttkbootstrap
+    filedialog = tk_filedialog
+    messagebox = tk_messagebox
+
 
 class RegenesisGUI:
     """GUI class for the Regenesis application."""
 
-    def __init__(self):
-        import time
-
-        # Initialize preferences manager
-        self.prefs = PreferencesManager()
-
-        # Create main window with ttkbootstrap theme
-        # Load theme from preferences
-        theme = self.prefs.get_theme()
-        self.root = ttk.Window(themename=theme)
-
-        # Set application icon
-        icon_path = os.path.join(os.path.dirname(__file__), 'oak_leaf_icon_512.png')
-        if os.path.exists(icon_path):
-            try:
-                icon_image = tk.PhotoImage(file=icon_path)
-                self.root.iconphoto(True, icon_image)
-            except Exception:
-                pass  # If icon fails to load, continue without it
+    # Project windows open in this process, the main window included, in the
+    # order they were opened
+    _open_windows = []
 
-        # Move it completely off-screen before any update
-        self.root.geometry('1x1+-10000+-10000')
-        self.root.withdraw()  # Hide it immediately
+    def __init__(self, master=None, prefs=None):
+        """Create the main window, or an extra project window when master is given.
 
-        # Set application name for macOS menu bar
-        self.root.createcommand('tk::mac::ShowPreferences', self._show_preferences)
+        Extra windows are Toplevels of master's Tk root: they share its
+        preferences, theme and already-imported modules, and skip the splash.
+        """
+        _load_tk()
 
-        # Create splash screen as a Toplevel
-        splash = self._create_splash_screen()
-        splash_start_time = time.time()
+        # Initialize preferences manager
+        self.prefs = prefs if prefs is not None else PreferencesManager()
 
-        # Force splash to display and process events
-        splash.update()
+        # Callbacks from when_started(), run once startup has finished (None after)
+        self._startup_callbacks = []
 
-        # Initialize app
-        self.app = Regenesis()
-        splash.update()  # Keep splash responsive
+        if master is None:
+            # Create main window with ttkbootstrap theme
+            # Load theme from preferences
+            theme = self.prefs.get_theme()
+            self.root = ttk.Window(themename=theme)
+            self._tk_root = self.root
+        else:
+            self.root = ttk.Toplevel(master)
+            self._tk_root = master
+        RegenesisGUI._open_windows.append(self)
+        self.root.protocol('WM_DELETE_WINDOW', self._close_window)
+        # Forget the window however it goes away (e.g. with its Tk root)
+        self.root.bind('<Destroy>', self._on_window_destroy, add='+')
+
+        # Hide it until startup finishes (an unmapped window is never drawn)
+        self.root.withdraw()
+
+        # Screen size, read once for centering both the splash and the window
+        self._screen_width = self.root.winfo_screenwidth()
+        self._screen_height = self.root.winfo_screenheight()
+
+        if master is None:
+            # Set application name for macOS menu bar
+            self.root.createcommand('tk::mac::ShowPreferences', self._show_preferences)
+
+        # Extra windows never show the splash; neither does development mode
+        # (or REGENESIS_NO_SPLASH), to keep the edit-and-restart loop short
+        show_splash = master is None and not (
+            os.environ.get('REGENESIS_NO_SPLASH') or self.prefs.is_development_mode())
+
+        if show_splash:
+            # Create splash screen as a Toplevel (it maps itself with one update())
+            splash = self._create_splash_screen()
+            splash_start_time = time.time()
+
+            # Import and build the app model on a worker thread (after the splash
+            # is on screen) so the splash keeps repainting while it loads. The
+            # worker only sets plain attributes; every Tk call stays on this thread.
+            self._splash_status.configure(text="Loading plant database...")
+            self.app = None
+            self._init_done = threading.Event()
+            self._init_thread = threading.Thread(target=self._background_init, daemon=True)
+            self._init_thread.start()
+        else:
+            # Build the model here; for extra windows regenesis is already
+            # imported by the first window, so this is quick
+            from regenesis import Regenesis
+            splash = None
+            self.app = Regenesis()
 
         self.root.title("Regenesis - Native Plant Designer")
 
         # Center the main window on the screen (same monitor as splash)
         window_width = 1000
         window_height = 700
-        self.root.update_idletasks()
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
+        x = (self._screen_width - window_width) // 2
+        y = (self._screen_height - window_height) // 2
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         self.current_file = None  # Track the currently open file
         self.selected_item = None  # Track selected tree item
         self._updating_properties = False  # Flag to prevent update loops
+        self._profile_enabled = False  # Log tree select/workspace timings to the console
         self._drag_item = None  # Track item being dragged
         self._drop_target = None  # Track current drop target
         self._drop_position = None  # Track drop position: 'above', 'below', or 'inside'
+        self._drag_type = None  # Type ('project'/'region') of the item being dragged
+        self._motion_type_cache = {}  # Target item ID -> type, for the current drag
+        self._drag_subtree = set()  # Dragged item and all its descendants (not valid drop targets)
+        self._last_motion_event = None  # Latest <B1-Motion> event not yet processed
+        self._motion_after_id = None  # Pending after() call that will process it
+        self._tree_cursor = ''  # Cursor currently set on the tree
+        self._delete_dialog = None  # Delete confirmation dialog, built on first use
+        self._prefs_dialog = None  # Preferences dialog, built on first use
+        self._tooltips = {}  # Widget path -> tooltip text
+        self._tooltip_tag = f'Tooltip{id(self)}'  # Bindtag shared by widgets with tooltips
+        self._prop_entry_tag = f'PropEntry{id(self)}'  # Bindtag shared by property entries
+        self._tooltip_window = None  # The one tooltip Toplevel, built on first hover
+        self._drag_selection = None  # Item last highlighted as drop target during this drag
+        self._hover_target = None  # Row whose bbox is cached in _hover_bbox during a drag
+        self._hover_bbox = None  # That row's bbox; cleared whenever the tree scrolls
 
         # Canvas pan/zoom state
         self.canvas_pan_x = 0  # Pan offset in pixels
@@ -84,29 +172,54 @@ class RegenesisGUI:
         self.selected_vertex = None  # Index of selected vertex
         self._dragging_vertex = False
         self.region_polygons = {}  # Dict mapping tree item IDs to polygon vertices
+        self._canvas_size = None  # (width, height) from the canvas's last <Configure> event
+        self._pending_workspace = None  # (name, item_type) waiting for the canvas to be sized
 
         # Track drag state for tree drag-and-drop
         self._drag_start_x = 0
         self._drag_start_y = 0
         self._has_moved = False
 
-        # Setup UI
-        splash.update()
+        if splash is None:
+            self._setup_ui()
+            self._finish_startup(None)
+            return
+
+        # Setup UI (repaint the splash status first, without handling input)
+        splash.update_idletasks()
         self._setup_ui()
 
-        # Ensure splash shows for at least 2 seconds
-        min_splash_time = 2.0  # seconds
-        elapsed = time.time() - splash_start_time
-        if elapsed < min_splash_time:
-            remaining = min_splash_time - elapsed
-            splash.after(int(remaining * 1000), lambda: self._finish_startup(splash))
-        else:
-            self._finish_startup(splash)
+        # Close the splash once the model is ready
+        self.root.after(50, self._check_init_done, splash, splash_start_time)
+
+    def _background_init(self):
+        """Build the app model off the Tk thread. Must not touch any widget."""
+        try:
+            from regenesis import Regenesis
+            self.app = Regenesis()
+        finally:
+            self._init_done.set()
+
+    def _check_init_done(self, splash, splash_start_time):
+        """Poll the worker until the model is ready, then finish startup."""
+        if (not self._init_done.is_set()
+                or time.time() - splash_start_time < SPLASH_MIN_VISIBLE):
+            self.root.after(50, self._check_init_done, splash, splash_start_time)
+            return
+
+        if self.app is None:
+            splash.destroy()
+            messagebox.showerror("Startup Failed", "Could not load the plant database.")
+            self.root.destroy()
+            return
+
+        self._finish_startup(splash)
 
     def _finish_startup(self, splash):
         """Complete the startup sequence by closing splash and showing main window."""
         # Close splash and show main window
-        splash.destroy()
+        if splash is not None:
+            splash.destroy()
         self.root.deiconify()
 
         # Bring window to front on macOS
@@ -114,6 +227,41 @@ class RegenesisGUI:
         self.root.attributes('-topmost', True)
         self.root.after_idle(self.root.attributes, '-topmost', False)
 
+        # Fill the tree and canvas after the first paint of the mapped window,
+        # then tell when_started() callers that startup is done
+        self.root.after_idle(self._populate_initial_content)
+        self.root.after_idle(self._run_startup_callbacks)
+
+        # Decode the window icon once the window is up. It's set as the
+        # default icon, so extra windows inherit it and don't load it again.
+        if self.root is self._tk_root:
+            self.root.after(100, self._load_icon)
+
+    def when_started(self, callback):
+        """Call callback once startup has finished and the window is filled in.
+
+        With the splash, the model is still loading when __init__ returns;
+        the callback runs after it's ready (right away if that has happened).
+        """
+        if self._startup_callbacks is None:
+            callback()
+        else:
+            self._startup_callbacks.append(callback)
+
+    def _run_startup_callbacks(self):
+        """Run the callbacks registered with when_started()."""
+        callbacks, self._startup_callbacks = self._startup_callbacks, None
+        for callback in callbacks:
+            callback()
+
+    def _load_icon(self):
+        """Set the application icon (the 512px PNG is slow to decode)."""
+        try:
+            self._icon_image = tk.PhotoImage(file=ICON_PATH)
+            self.root.iconphoto(True, self._icon_image)
+        except tk.TclError:
+            pass  # If icon is missing or fails to load, continue without it
+
     def _create_splash_screen(self):
         """Create and display a splash screen during startup."""
         splash = tk.Toplevel(self.root)
@@ -123,16 +271,13 @@ class RegenesisGUI:
         width = 400
         height = 300
 
-        # Get screen dimensions from the root window (which knows about the main monitor)
-        self.root.update_idletasks()
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        x = (screen_width - width) // 2
-        y = (screen_height - height) // 2
+        # Screen dimensions were read from the root window (which knows about
+        # the main monitor) in __init__
+        x = (self._screen_width - width) // 2
+        y = (self._screen_height - height) // 2
         splash.geometry(f"{width}x{height}+{x}+{y}")
-        splash.update_idletasks()
 
-        # Remove window decorations
+        # Remove window decorations (before the splash is first mapped)
         splash.overrideredirect(True)
 
         # Keep splash on top of all windows
@@ -160,22 +305,29 @@ class RegenesisGUI:
             fg='#558b2f'
         ).pack(pady=5)
 
-        # Add a simple plant icon using text
-        tk.Label(
-            frame,
-            text="🦋 🌸",
-            font=("Arial", 48),
-            bg='#e8f5e9'
-        ).pack(pady=20)
-
-        # Add loading message
-        tk.Label(
+        # Add the plant icon. A small PNG draws faster than emoji at 48pt,
+        # which makes Tk resolve a fallback color-emoji font on first use.
+        icon_path = os.path.join(SCRIPT_DIR, 'oak_leaf_icon_64.png')
+        try:
+            splash.icon_image = tk.PhotoImage(master=splash, file=icon_path)  # Keep a reference
+            tk.Label(frame, image=splash.icon_image, bg='#e8f5e9').pack(pady=20)
+        except tk.TclError:
+            tk.Label(
+                frame,
+                text="🦋 🌸",
+                font=("Arial", 48),
+                bg='#e8f5e9'
+            ).pack(pady=20)
+
+        # Add loading message (updated with the current startup phase)
+        self._splash_status = tk.Label(
             frame,
             text="Loading...",
             font=("Arial", 12, "italic"),
             bg='#e8f5e9',
             fg='#666666'
-        ).pack(pady=10)
+        )
+        self._splash_status.pack(pady=10)
 
         splash.update()
         return splash
@@ -209,12 +361,14 @@ class RegenesisGUI:
         tree_frame = tk.Frame(tree_section)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=5, padx=5)
 
-        tree_scroll = tk.Scrollbar(tree_frame)
-        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self._tree_scroll = tk.Scrollbar(tree_frame)
+        self._tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.tree = ttk.Treeview(tree_frame, yscrollcommand=tree_scroll.set, height=15, bootstyle="primary")
+        # The tree reports every change of its view (scrolling, autoscroll
+        # during a drag, see()) through yscrollcommand
+        self.tree = ttk.Treeview(tree_frame, yscrollcommand=self._on_tree_yscroll, height=15, bootstyle="primary")
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        tree_scroll.config(command=self.tree.yview)
+        self._tree_scroll.config(command=self.tree.yview)
 
         # Configure tree item styles - make project largest, regions bold
         self.tree.tag_configure('project', font=("Helvetica", 14, "bold"))
@@ -223,16 +377,31 @@ class RegenesisGUI:
         # Bind tree selection event
         self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
 
-        # Bind right-click for context menu
-        self.tree.bind('<Button-2>', self._show_context_menu)  # macOS right-click
-        self.tree.bind('<Control-Button-1>', self._show_context_menu)  # macOS ctrl-click
+        # Context menu is built once and re-posted on each right-click; its
+        # commands act on self.selected_item at the time they're chosen
+        self._context_menu = tk.Menu(self.root, tearoff=0)
+        self._context_menu.add_command(label="Add Child Region", command=self._add_child_region)
+        self._context_menu.add_separator()
+        self._context_menu.add_command(label="Delete", command=self._delete_item)
+
+        # Right-click (Button-2 on macOS, Button-3 elsewhere) opens the context menu
+        # Virtual events are defined for the whole interpreter, so only the
+        # main window registers it; extra windows reuse the definition
+        if self.root is self._tk_root:
+            self.tree.event_add('<<ContextMenu>>', '<Button-2>', '<Button-3>')
+        self.tree.bind('<<ContextMenu>>', self._show_context_menu)
+
+        # Ctrl-click is the macOS context menu. It's bound directly: Tk picks
+        # the more specific <Control-Button-1> over <ButtonPress-1>, but would
+        # pick <ButtonPress-1> over a virtual event.
+        self.tree.bind('<Control-Button-1>', self._show_context_menu)
 
         # Bind double-click for in-tree renaming (alternative to Properties panel)
         self.tree.bind('<Double-Button-1>', self._start_tree_rename)
 
         # Bind drag-and-drop events
         self.tree.bind('<ButtonPress-1>', self._on_drag_start)
-        self.tree.bind('<B1-Motion>', self._on_drag_motion)
+        self.tree.bind('<B1-Motion>', self._queue_drag_motion)
         self.tree.bind('<ButtonRelease-1>', self._on_drag_release)
 
         # PROPERTIES PANEL (bottom section of left paned window)
@@ -243,132 +412,20 @@ class RegenesisGUI:
         self.properties_container = tk.Frame(properties_section)
         self.properties_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # PROJECT PROPERTIES FORM
-        self.project_props_frame = ttk.Labelframe(self.properties_container, text="Project Properties", bootstyle="primary", padding=10)
-
-        # Name
-        ttk.Label(self.project_props_frame, text="Name:", font=("Helvetica", 10)).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.project_name_var = tk.StringVar()
-        self.project_name_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_name_var, width=20)
-        self.project_name_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
-        self.project_name_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.project_name_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        # Latitude
-        ttk.Label(self.project_props_frame, text="Latitude:", font=("Helvetica", 10)).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.project_latitude_var = tk.StringVar()
-        self.project_latitude_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_latitude_var, width=20)
-        self.project_latitude_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
-        self.project_latitude_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.project_latitude_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        # Longitude
-        ttk.Label(self.project_props_frame, text="Longitude:", font=("Helvetica", 10)).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.project_longitude_var = tk.StringVar()
-        self.project_longitude_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_longitude_var, width=20)
-        self.project_longitude_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
-        self.project_longitude_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.project_longitude_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        # Width and Length
-        dims_frame = ttk.Frame(self.project_props_frame)
-        dims_frame.grid(row=3, column=0, columnspan=2, sticky=tk.EW, padx=5, pady=5)
-
-        ttk.Label(dims_frame, text="Width:", font=("Helvetica", 10)).pack(side=tk.LEFT, padx=(0, 5))
-        self.project_width_var = tk.StringVar()
-        self.project_width_entry = ttk.Entry(dims_frame, textvariable=self.project_width_var, width=8)
-        self.project_width_entry.pack(side=tk.LEFT, padx=(0, 15))
-        self.project_width_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.project_width_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        ttk.Label(dims_frame, text="Length:", font=("Helvetica", 10)).pack(side=tk.LEFT, padx=(0, 5))
-        self.project_length_var = tk.StringVar()
-        self.project_length_entry = ttk.Entry(dims_frame, textvariable=self.project_length_var, width=8)
-        self.project_length_entry.pack(side=tk.LEFT)
-        self.project_length_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.project_length_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        # Units (radio buttons)
-        units_frame = ttk.Frame(self.project_props_frame)
-        units_frame.grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        # One named font shared by every property label, so Tk resolves it once
+        from tkinter import font as tkfont
+        self._prop_font = tkfont.Font(root=self.root, family="Helvetica", size=10)
 
-        ttk.Label(units_frame, text="Units:", font=("Helvetica", 10)).pack(side=tk.LEFT, padx=(0, 10))
-        self.project_units_var = tk.StringVar(value="feet")
-        ttk.Radiobutton(units_frame, text="Feet", variable=self.project_units_var, value="feet",
-                       command=self._apply_property_change, bootstyle="primary").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(units_frame, text="Meters", variable=self.project_units_var, value="meters",
-                       command=self._apply_property_change, bootstyle="primary").pack(side=tk.LEFT, padx=5)
+        # Property entries apply on Return and FocusOut through one shared
+        # bindtag instead of two bindings per entry. The tag is per window
+        # because bind_class is shared by every window in this interpreter.
+        self.root.bind_class(self._prop_entry_tag, '<Return>', lambda _: self._apply_property_change())
+        self.root.bind_class(self._prop_entry_tag, '<FocusOut>', lambda _: self._apply_property_change())
 
-        self.project_props_frame.columnconfigure(1, weight=1)
-
-        # REGION PROPERTIES FORM
-        self.region_props_frame = ttk.Labelframe(self.properties_container, text="Region Properties", bootstyle="success", padding=10)
-
-        # Name
-        ttk.Label(self.region_props_frame, text="Name:", font=("Helvetica", 10)).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.region_name_var = tk.StringVar()
-        self.region_name_entry = ttk.Entry(self.region_props_frame, textvariable=self.region_name_var, width=20)
-        self.region_name_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
-        self.region_name_entry.bind('<Return>', lambda _: self._apply_property_change())
-        self.region_name_entry.bind('<FocusOut>', lambda _: self._apply_property_change())
-
-        # Region Type
-        ttk.Label(self.region_props_frame, text="Region Type:", font=("Helvetica", 10)).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.region_type_var = tk.StringVar(value="meadow")
-        self.region_type_menu = ttk.OptionMenu(
-            self.region_props_frame,
-            self.region_type_var,
-            "meadow",
-            "meadow", "layered", "pond", "stream", "building", "drive", "patio/deck", "path", "wire fence", "solid fence",
-            command=lambda _: self._apply_property_change(),
-            bootstyle="success"
-        )
-        self.region_type_menu.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
-
-        # Soil Moisture
-        ttk.Label(self.region_props_frame, text="Soil Moisture:", font=("Helvetica", 10)).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.soil_moisture_var = tk.StringVar(value="medium")
-        self.soil_moisture_menu = ttk.OptionMenu(
-            self.region_props_frame,
-            self.soil_moisture_var,
-            "medium",
-            "dry", "med-dry", "medium", "medium-wet", "wet",
-            command=lambda _: self._apply_property_change(),
-            bootstyle="info"
-        )
-        self.soil_moisture_menu.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
-
-        # Soil Type
-        ttk.Label(self.region_props_frame, text="Soil Type:", font=("Helvetica", 10)).grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        self.soil_type_var = tk.StringVar(value="loam")
-        self.soil_type_menu = ttk.OptionMenu(
-            self.region_props_frame,
-            self.soil_type_var,
-            "loam",
-            "sand", "clay", "loam",
-            command=lambda _: self._apply_property_change(),
-            bootstyle="info"
-        )
-        self.soil_type_menu.grid(row=3, column=1, padx=5, pady=5, sticky=tk.EW)
-
-        # Sun
-        ttk.Label(self.region_props_frame, text="Sun:", font=("Helvetica", 10)).grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        self.sun_var = tk.StringVar(value="full-sun")
-        self.sun_menu = ttk.OptionMenu(
-            self.region_props_frame,
-            self.sun_var,
-            "full-sun",
-            "shade", "part-sun", "full-sun",
-            command=lambda _: self._apply_property_change(),
-            bootstyle="warning"
-        )
-        self.sun_menu.grid(row=4, column=1, padx=5, pady=5, sticky=tk.EW)
-
-        self.region_props_frame.columnconfigure(1, weight=1)
-
-        # Initially hide both (will show based on selection)
-        self.project_props_frame.pack_forget()
-        self.region_props_frame.pack_forget()
+        # The project and region forms are built on first selection (see
+        # _ensure_project_props_frame / _ensure_region_props_frame)
+        self.project_props_frame = None
+        self.region_props_frame = None
 
         # RIGHT PANEL - Workspace
         workspace_frame = tk.Frame(main_container, relief=tk.SUNKEN, borderwidth=1, bg='white')
@@ -419,7 +476,7 @@ class RegenesisGUI:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Bind canvas resize to update rulers and reposition items
-        self.canvas.bind('<Configure>', lambda _e: self._on_canvas_resize())
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
 
         # Bind canvas pan/zoom events
         self.canvas.bind('<Button-2>', self._start_pan)  # Middle click on macOS (Button-2)
@@ -441,12 +498,24 @@ class RegenesisGUI:
         self.canvas.bind('<ButtonRelease-1>', self._on_canvas_release)
         self.canvas.bind('<Control-Button-1>', self._on_canvas_right_click)  # macOS ctrl-click for delete
 
-        # Initial message
-        self.canvas_text = self.canvas.create_text(
+        # Message text items are created once and re-used: they're tagged
+        # 'message' so workspace redraws hide them instead of deleting them
+        self._workspace_title = self.canvas.create_text(
             400, 300,
             text="Select an item from the project tree",
             font=("Arial", 16),
-            fill="#999999"
+            fill="#999999",
+            justify=tk.CENTER,
+            tags=('message',)
+        )
+        self._workspace_subtitle = self.canvas.create_text(
+            400, 360,
+            text="",
+            font=("Arial", 14),
+            fill="#7f8c8d",
+            justify=tk.CENTER,
+            state='hidden',
+            tags=('message',)
         )
 
         # Bottom section - Console (fixed height, not in PanedWindow)
@@ -526,6 +595,11 @@ class RegenesisGUI:
         # Add initial welcome message
         self._log_info("Console initialized. Ready.")
 
+        # The tree/canvas content is filled in by _populate_initial_content
+        # once the window is shown (see _finish_startup)
+
+    def _populate_initial_content(self):
+        """Fill the tree with sample data, or show the empty-tree message."""
         # Populate with sample data (only in development mode)
         if self.prefs.is_development_mode():
             self._populate_sample_tree()
@@ -534,25 +608,162 @@ class RegenesisGUI:
             self._log_info("No projects loaded. Use File → New to create a project.")
             self._show_empty_tree_message()
 
+    def _ensure_project_props_frame(self):
+        """Build the project properties form on first use and return it."""
+        if self.project_props_frame is not None:
+            return self.project_props_frame
+
+        # PROJECT PROPERTIES FORM
+        self.project_props_frame = ttk.Labelframe(self.properties_container, text="Project Properties", bootstyle="primary", padding=10)
+
+        # Name
+        ttk.Label(self.project_props_frame, text="Name:", font=self._prop_font).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.project_name_var = tk.StringVar()
+        self.project_name_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_name_var, width=20)
+        self.project_name_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.project_name_entry.bindtags((self._prop_entry_tag,) + self.project_name_entry.bindtags())
+
+        # Latitude
+        ttk.Label(self.project_props_frame, text="Latitude:", font=self._prop_font).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.project_latitude_var = tk.StringVar()
+        self.project_latitude_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_latitude_var, width=20)
+        self.project_latitude_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.project_latitude_entry.bindtags((self._prop_entry_tag,) + self.project_latitude_entry.bindtags())
+
+        # Longitude
+        ttk.Label(self.project_props_frame, text="Longitude:", font=self._prop_font).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.project_longitude_var = tk.StringVar()
+        self.project_longitude_entry = ttk.Entry(self.project_props_frame, textvariable=self.project_longitude_var, width=20)
+        self.project_longitude_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.project_longitude_entry.bindtags((self._prop_entry_tag,) + self.project_longitude_entry.bindtags())
+
+        # Width and Length
+        dims_frame = ttk.Frame(self.project_props_frame)
+        dims_frame.grid(row=3, column=0, columnspan=2, sticky=tk.EW, padx=5, pady=5)
+
+        ttk.Label(dims_frame, text="Width:", font=self._prop_font).pack(side=tk.LEFT, padx=(0, 5))
+        self.project_width_var = tk.StringVar()
+        self.project_width_entry = ttk.Entry(dims_frame, textvariable=self.project_width_var, width=8)
+        self.project_width_entry.pack(side=tk.LEFT, padx=(0, 15))
+        self.project_width_entry.bindtags((self._prop_entry_tag,) + self.project_width_entry.bindtags())
+
+        ttk.Label(dims_frame, text="Length:", font=self._prop_font).pack(side=tk.LEFT, padx=(0, 5))
+        self.project_length_var = tk.StringVar()
+        self.project_length_entry = ttk.Entry(dims_frame, textvariable=self.project_length_var, width=8)
+        self.project_length_entry.pack(side=tk.LEFT)
+        self.project_length_entry.bindtags((self._prop_entry_tag,) + self.project_length_entry.bindtags())
+
+        # Units (radio buttons)
+        units_frame = ttk.Frame(self.project_props_frame)
+        units_frame.grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+
+        ttk.Label(units_frame, text="Units:", font=self._prop_font).pack(side=tk.LEFT, padx=(0, 10))
+        self.project_units_var = tk.StringVar(value="feet")
+        ttk.Radiobutton(units_frame, text="Feet", variable=self.project_units_var, value="feet",
+                       command=self._apply_property_change, bootstyle="primary").pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(units_frame, text="Meters", variable=self.project_units_var, value="meters",
+                       command=self._apply_property_change, bootstyle="primary").pack(side=tk.LEFT, padx=5)
+
+        self.project_props_frame.columnconfigure(1, weight=1)
+
+        return self.project_props_frame
+
+    def _ensure_region_props_frame(self):
+        """Build the region properties form on first use and return it."""
+        if self.region_props_frame is not None:
+            return self.region_props_frame
+
+        # REGION PROPERTIES FORM
+        self.region_props_frame = ttk.Labelframe(self.properties_container, text="Region Properties", bootstyle="success", padding=10)
+
+        # Name
+        ttk.Label(self.region_props_frame, text="Name:", font=self._prop_font).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.region_name_var = tk.StringVar()
+        self.region_name_entry = ttk.Entry(self.region_props_frame, textvariable=self.region_name_var, width=20)
+        self.region_name_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.region_name_entry.bindtags((self._prop_entry_tag,) + self.region_name_entry.bindtags())
+
+        # Region Type
+        ttk.Label(self.region_props_frame, text="Region Type:", font=self._prop_font).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.region_type_var = tk.StringVar(value="meadow")
+        self.region_type_combo = ttk.Combobox(
+            self.region_props_frame,
+            textvariable=self.region_type_var,
+            values=("meadow", "layered", "pond", "stream", "building", "drive", "patio/deck", "path", "wire fence", "solid fence"),
+            state='readonly',
+            bootstyle="success"
+        )
+        self.region_type_combo.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.region_type_combo.bind('<<ComboboxSelected>>', lambda _: self._apply_property_change())
+
+        # Soil Moisture
+        ttk.Label(self.region_props_frame, text="Soil Moisture:", font=self._prop_font).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.soil_moisture_var = tk.StringVar(value="medium")
+        self.soil_moisture_combo = ttk.Combobox(
+            self.region_props_frame,
+            textvariable=self.soil_moisture_var,
+            values=("dry", "med-dry", "medium", "medium-wet", "wet"),
+            state='readonly',
+            bootstyle="info"
+        )
+        self.soil_moisture_combo.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.soil_moisture_combo.bind('<<ComboboxSelected>>', lambda _: self._apply_property_change())
+
+        # Soil Type
+        ttk.Label(self.region_props_frame, text="Soil Type:", font=self._prop_font).grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.soil_type_var = tk.StringVar(value="loam")
+        self.soil_type_combo = ttk.Combobox(
+            self.region_props_frame,
+            textvariable=self.soil_type_var,
+            values=("sand", "clay", "loam"),
+            state='readonly',
+            bootstyle="info"
+        )
+        self.soil_type_combo.grid(row=3, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.soil_type_combo.bind('<<ComboboxSelected>>', lambda _: self._apply_property_change())
+
+        # Sun
+        ttk.Label(self.region_props_frame, text="Sun:", font=self._prop_font).grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.sun_var = tk.StringVar(value="full-sun")
+        self.sun_combo = ttk.Combobox(
+            self.region_props_frame,
+            textvariable=self.sun_var,
+            values=("shade", "part-sun", "full-sun"),
+            state='readonly',
+            bootstyle="warning"
+        )
+        self.sun_combo.grid(row=4, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.sun_combo.bind('<<ComboboxSelected>>', lambda _: self._apply_property_change())
+
+        self.region_props_frame.columnconfigure(1, weight=1)
+
+        return self.region_props_frame
+
     def _create_menu(self):
         """Create the menu bar with File menu."""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
 
+        # Shortcuts use Cmd on macOS and Ctrl everywhere else
+        if sys.platform == 'darwin':
+            modifier, accel = 'Command', 'Cmd'
+        else:
+            modifier, accel = 'Control', 'Ctrl'
+
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
 
-        file_menu.add_command(label="New", command=self._new_project, accelerator="Cmd+N")
-        file_menu.add_command(label="New Window", command=self._new_window, accelerator="Shift+Cmd+N")
-        file_menu.add_command(label="Open...", command=self._open_project, accelerator="Cmd+O")
+        file_menu.add_command(label="New", command=self._new_project, accelerator=f"{accel}+N")
+        file_menu.add_command(label="New Window", command=self._new_window, accelerator=f"Shift+{accel}+N")
+        file_menu.add_command(label="Open...", command=self._open_project, accelerator=f"{accel}+O")
         file_menu.add_separator()
-        file_menu.add_command(label="Save", command=self._save_project, accelerator="Cmd+S")
-        file_menu.add_command(label="Save As...", command=self._save_as_project, accelerator="Shift+Cmd+S")
+        file_menu.add_command(label="Save", command=self._save_project, accelerator=f"{accel}+S")
+        file_menu.add_command(label="Save As...", command=self._save_as_project, accelerator=f"Shift+{accel}+S")
         file_menu.add_separator()
         file_menu.add_command(label="Rename...", command=self._rename_project)
         file_menu.add_separator()
-        file_menu.add_command(label="Close Window", command=self.root.destroy)
+        file_menu.add_command(label="Close Window", command=self._close_window)
         file_menu.add_command(label="Exit", command=self._exit_app)
 
         # View menu
@@ -560,36 +771,48 @@ class RegenesisGUI:
         menubar.add_cascade(label="View", menu=view_menu)
 
         # On macOS, we need to use createcommand to properly register shortcuts
-        # This makes them appear active (not grayed out) in the menu
-        self.root.createcommand('zoom_in', self._zoom_in)
-        self.root.createcommand('zoom_out', self._zoom_out)
-        self.root.createcommand('reset_zoom', self._reset_view)
-        self.root.createcommand('fit_to_design', self._fit_to_design_extents)
-        self.root.createcommand('fit_to_region', self._fit_to_region)
-
-        view_menu.add_command(label="Zoom In", command=self._zoom_in, accelerator="Cmd++")
-        view_menu.add_command(label="Zoom Out", command=self._zoom_out, accelerator="Cmd+-")
-        view_menu.add_command(label="Reset Zoom", command=self._reset_view, accelerator="Cmd+0")
+        # This makes them appear active (not grayed out) in the menu. The
+        # commands are global to the interpreter, so the main window registers
+        # them once and each call goes to the window that has focus.
+        if self.root is self._tk_root:
+            view_commands = {
+                'zoom_in': '_zoom_in',
+                'zoom_out': '_zoom_out',
+                'reset_zoom': '_reset_view',
+                'fit_to_design': '_fit_to_design_extents',
+                'fit_to_region': '_fit_to_region',
+            }
+            for name, method in view_commands.items():
+                self.root.createcommand(
+                    name, lambda method=method: getattr(self._focused_window(), method)())
+
+        view_menu.add_command(label="Zoom In", command=self._zoom_in, accelerator=f"{accel}++")
+        view_menu.add_command(label="Zoom Out", command=self._zoom_out, accelerator=f"{accel}+-")
+        view_menu.add_command(label="Reset Zoom", command=self._reset_view, accelerator=f"{accel}+0")
         view_menu.add_separator()
-        view_menu.add_command(label="Fit to Design Extents", command=self._fit_to_design_extents, accelerator="Cmd+1")
-        view_menu.add_command(label="Fit to Region", command=self._fit_to_region, accelerator="Cmd+2")
+        view_menu.add_command(label="Fit to Design Extents", command=self._fit_to_design_extents, accelerator=f"{accel}+1")
+        view_menu.add_command(label="Fit to Region", command=self._fit_to_region, accelerator=f"{accel}+2")
         view_menu.add_separator()
         view_menu.add_checkbutton(label="Show Grid", command=self._toggle_grid)
 
-        # Bind keyboard shortcuts for View menu
-        self.root.bind_all('<Command-plus>', lambda _e: self._zoom_in())
-        self.root.bind_all('<Command-equal>', lambda _e: self._zoom_in())  # Cmd+= (same key as +)
-        self.root.bind_all('<Command-minus>', lambda _e: self._zoom_out())
-        self.root.bind_all('<Command-0>', lambda _e: self._reset_view())
-        self.root.bind_all('<Command-1>', lambda _e: self._fit_to_design_extents())
-        self.root.bind_all('<Command-2>', lambda _e: self._fit_to_region())
-
-        # Also bind File menu shortcuts
-        self.root.bind_all('<Command-n>', lambda _e: self._new_project())
-        self.root.bind_all('<Command-Shift-N>', lambda _e: self._new_window())
-        self.root.bind_all('<Command-o>', lambda _e: self._open_project())
-        self.root.bind_all('<Command-s>', lambda _e: self._save_project())
-        self.root.bind_all('<Command-Shift-S>', lambda _e: self._save_as_project())
+        # Bind the keyboard shortcuts shown as accelerators. These are bound on
+        # this window (not bind_all) so each project window's shortcuts drive
+        # that window.
+        shortcuts = {
+            'plus': self._zoom_in,
+            'equal': self._zoom_in,  # Cmd+= (same key as +)
+            'minus': self._zoom_out,
+            '0': self._reset_view,
+            '1': self._fit_to_design_extents,
+            '2': self._fit_to_region,
+            'n': self._new_project,
+            'Shift-N': self._new_window,
+            'o': self._open_project,
+            's': self._save_project,
+            'Shift-S': self._save_as_project,
+        }
+        for key, command in shortcuts.items():
+            self.root.bind(f'<{modifier}-{key}>', lambda _e, command=command: command())
 
     def _new_project(self):
         """Create a new project."""
@@ -601,17 +824,71 @@ class RegenesisGUI:
 
     def _new_window(self):
         """Open a new window with a new project."""
-        import subprocess
-        import sys
-        import os
-        # Launch a new instance of the application
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        main_script = os.path.join(script_dir, 'main.py')
-        subprocess.Popen([sys.executable, main_script])
+        if '--separate-process' in sys.argv:
+            import subprocess
+            # Launch a new instance of the application
+            main_script = os.path.join(SCRIPT_DIR, 'main.py')
+            subprocess.Popen([sys.executable, main_script, '--separate-process'])
+            return
+
+        # Open the window in this process, reusing the loaded modules and prefs
+        RegenesisGUI(master=self._tk_root, prefs=self.prefs)
+
+    def _windows_on_root(self):
+        """Return the open project windows that share this window's Tk root."""
+        return [window for window in self._open_windows
+                if window._tk_root is self._tk_root]
+
+    def _forget_window(self):
+        """Drop this window from the open windows and remove its class bindings.
+
+        The class bindings' callbacks hold this instance, so leaving them
+        behind would keep a closed window alive.
+        """
+        if self in self._open_windows:
+            self._open_windows.remove(self)
+        for tag in (self._prop_entry_tag, self._tooltip_tag):
+            for sequence in self.root.bind_class(tag):
+                self.root.unbind_class(tag, sequence)
+
+    def _on_window_destroy(self, event):
+        """Forget this window when its toplevel is destroyed."""
+        # <Destroy> on a toplevel also fires for each of its children
+        if event.widget is self.root:
+            self._forget_window()
+
+    def _focused_window(self):
+        """Return the open project window that has focus (the newest if none does)."""
+        windows = self._windows_on_root()
+        try:
+            focus = self.root.focus_get()
+        except KeyError:
+            # focus_get() can't map some Tk-internal widgets (e.g. popdowns)
+            focus = None
+        if focus is not None:
+            toplevel = focus.winfo_toplevel()
+            for window in windows:
+                if window.root is toplevel:
+                    return window
+        return windows[-1] if windows else self
+
+    def _close_window(self):
+        """Close this project window; the app quits when the last one closes.
+
+        The main window is the Tk root, and destroying it would take every
+        other window with it, so while others are open it is only withdrawn.
+        """
+        self._forget_window()
+        windows = self._windows_on_root()
+        if not windows:
+            self._tk_root.destroy()
+        elif self.root is self._tk_root:
+            self.root.withdraw()
+        else:
+            self.root.destroy()
 
     def _exit_app(self):
         """Exit the entire application (close all windows)."""
-        import sys
         sys.exit(0)
 
     def _open_project(self):
@@ -701,18 +978,53 @@ class RegenesisGUI:
 
     def _show_preferences(self):
         """Show preferences dialog with theme selection and other settings."""
+        # The dialog is built on first use, then hidden and re-shown
+        if self._prefs_dialog is None:
+            self._build_preferences_dialog()
+        dialog = self._prefs_dialog
+        if dialog.winfo_viewable():
+            # Already open (e.g. the macOS Preferences menu item while it's up)
+            dialog.lift()
+            return
+
+        # Load the current preferences into the form
+        current_location = self.prefs.get_location()
+        lat_value = current_location[0] if current_location else ""
+        lon_value = current_location[1] if current_location else ""
+        self._prefs_lat_var.set(str(lat_value) if lat_value else "")
+        self._prefs_lon_var.set(str(lon_value) if lon_value else "")
+        self._prefs_dev_var.set(self.prefs.is_development_mode())
+
+        # Track the selected theme (for preview without saving)
+        current_theme = self.root.style.theme.name
+        self._prefs_selected_theme = current_theme
+        for theme_name, btn in self._theme_buttons.items():
+            btn.configure(bootstyle="success" if theme_name == current_theme else "outline-primary")
+
+        self._prefs_closed.set(False)
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        dialog.wait_variable(self._prefs_closed)
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _build_preferences_dialog(self):
+        """Create the (hidden) preferences dialog."""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Preferences")
-        dialog.geometry("550x750")
         dialog.transient(self.root)
-        dialog.grab_set()
 
         # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 550) // 2
-        y = (dialog.winfo_screenheight() - 750) // 2
+        x = (self._screen_width - 550) // 2
+        y = (self._screen_height - 750) // 2
         dialog.geometry(f"550x750+{x}+{y}")
 
+        # Set when the dialog is closed; _show_preferences waits on it
+        self._prefs_closed = tk.BooleanVar(dialog)
+        dialog.protocol('WM_DELETE_WINDOW', lambda: self._prefs_closed.set(True))
+
         # Main frame with padding and scrollbar
         main_frame = ttk.Frame(dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -724,36 +1036,31 @@ class RegenesisGUI:
         location_frame = ttk.Labelframe(main_frame, text="Location", bootstyle="info", padding=15)
         location_frame.pack(fill=tk.X, pady=(0, 10))
 
-        # Get current location
-        current_location = self.prefs.get_location()
-        lat_value = current_location[0] if current_location else ""
-        lon_value = current_location[1] if current_location else ""
-
         # Latitude
         lat_container = ttk.Frame(location_frame)
         lat_container.pack(fill=tk.X, pady=5)
         ttk.Label(lat_container, text="Latitude:", width=10).pack(side=tk.LEFT, padx=(0, 10))
-        lat_var = tk.StringVar(value=str(lat_value) if lat_value else "")
-        lat_entry = ttk.Entry(lat_container, textvariable=lat_var, width=20)
+        self._prefs_lat_var = tk.StringVar(dialog)
+        lat_entry = ttk.Entry(lat_container, textvariable=self._prefs_lat_var, width=20)
         lat_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # Longitude
         lon_container = ttk.Frame(location_frame)
         lon_container.pack(fill=tk.X, pady=5)
         ttk.Label(lon_container, text="Longitude:", width=10).pack(side=tk.LEFT, padx=(0, 10))
-        lon_var = tk.StringVar(value=str(lon_value) if lon_value else "")
-        lon_entry = ttk.Entry(lon_container, textvariable=lon_var, width=20)
+        self._prefs_lon_var = tk.StringVar(dialog)
+        lon_entry = ttk.Entry(lon_container, textvariable=self._prefs_lon_var, width=20)
         lon_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # DEVELOPMENT MODE SECTION
         dev_frame = ttk.Labelframe(main_frame, text="Development", bootstyle="warning", padding=15)
         dev_frame.pack(fill=tk.X, pady=(0, 10))
 
-        dev_var = tk.BooleanVar(value=self.prefs.is_development_mode())
+        self._prefs_dev_var = tk.BooleanVar(dialog)
         dev_check = ttk.Checkbutton(
             dev_frame,
             text="Development Mode (loads sample 'Smith Residence' project on startup)",
-            variable=dev_var,
+            variable=self._prefs_dev_var,
             bootstyle="success-round-toggle"
         )
         dev_check.pack(anchor=tk.W)
@@ -764,50 +1071,32 @@ class RegenesisGUI:
 
         ttk.Label(theme_frame, text="Choose a theme:", font=("Helvetica", 11)).pack(anchor=tk.W, pady=(0, 10))
 
-        # Get current theme
-        current_theme = self.root.style.theme.name
-
-        # Theme options with descriptions
-        themes = {
-            "flatly": "Modern & Clean (Default)",
-            "litera": "Nature-Friendly Earth Tones",
-            "minty": "Fresh Green",
-            "cosmo": "Clean & Bright",
-            "yeti": "Soft & Modern",
-            "journal": "Classic & Professional",
-            "sandstone": "Warm & Natural",
-            "darkly": "Dark Mode",
-            "superhero": "Dark Blue",
-            "solar": "Dark with High Contrast"
-        }
-
         # Create a container frame for the grid layout
         buttons_container = ttk.Frame(theme_frame)
         buttons_container.pack(fill=tk.BOTH, expand=True)
 
-        # Track the selected theme (for preview without saving)
-        selected_theme = {'name': current_theme}
-
         # Theme preview function
         def preview_theme(theme_name):
             """Preview a theme without saving it."""
-            self.root.style.theme_use(theme_name)
-            selected_theme['name'] = theme_name
-
-        # Create theme buttons in a grid
+            # Re-applying the active theme would restyle every widget for nothing
+            if self.root.style.theme.name != theme_name:
+                self.root.style.theme_use(theme_name)
+            self._prefs_selected_theme = theme_name
+
+        # Create theme buttons in a grid (styled for the current theme
+        # each time the dialog is shown)
+        self._theme_buttons = {}
         row, col = 0, 0
-        for theme_name, description in themes.items():
-            # Determine button style based on whether it's selected
-            btn_style = "success" if theme_name == current_theme else "outline-primary"
-
+        for theme_name, description in THEMES:
             btn = ttk.Button(
                 buttons_container,
                 text=f"{description}",
                 width=22,
-                bootstyle=btn_style,
+                bootstyle="outline-primary",
                 command=lambda t=theme_name: preview_theme(t)
             )
             btn.grid(row=row, column=col, padx=5, pady=5, sticky=tk.EW)
+            self._theme_buttons[theme_name] = btn
 
             col += 1
             if col > 1:  # 2 columns
@@ -831,8 +1120,8 @@ class RegenesisGUI:
         def save_preferences():
             # Save location
             try:
-                lat_str = lat_var.get().strip()
-                lon_str = lon_var.get().strip()
+                lat_str = self._prefs_lat_var.get().strip()
+                lon_str = self._prefs_lon_var.get().strip()
                 if lat_str and lon_str:
                     latitude = float(lat_str)
                     longitude = float(lon_str)
@@ -848,25 +1137,27 @@ class RegenesisGUI:
                 return False
 
             # Save development mode
-            self.prefs.set_development_mode(dev_var.get())
+            self.prefs.set_development_mode(self._prefs_dev_var.get())
 
             # Save theme (if it changed)
-            if selected_theme['name'] != self.prefs.get_theme():
-                self.prefs.set_theme(selected_theme['name'])
+            if self._prefs_selected_theme != self.prefs.get_theme():
+                self.prefs.set_theme(self._prefs_selected_theme)
 
+            # Write all changes from this dialog to disk in one go
+            self.prefs.flush()
             return True
 
         # Save and close function
         def save_and_close():
             if save_preferences():
-                dialog.destroy()
+                self._prefs_closed.set(True)
 
         # Cancel function - revert theme to original and close
         def cancel_and_close():
             # Revert theme to original if it was changed
             if self.root.style.theme.name != self.prefs.get_theme():
                 self.root.style.theme_use(self.prefs.get_theme())
-            dialog.destroy()
+            self._prefs_closed.set(True)
 
         # Button frame
         btn_frame = ttk.Frame(main_frame)
@@ -902,38 +1193,23 @@ class RegenesisGUI:
         )
         cancel_btn.pack(side=tk.LEFT, padx=5)
 
-        # Ensure dialog is properly displayed and interactive
-        dialog.update_idletasks()
-        dialog.deiconify()
-        dialog.lift()
-
-        dialog.wait_window()
+        self._prefs_dialog = dialog
 
     def _apply_theme(self, theme_name, dialog=None):
         """Apply the selected theme."""
         try:
-            self.root.style.theme_use(theme_name)
+            if self.root.style.theme.name != theme_name:
+                self.root.style.theme_use(theme_name)
 
             # Save theme to preferences
             self.prefs.set_theme(theme_name)
+            self.prefs.flush()
 
             # Show confirmation
             if dialog:
                 # Update button styles in the dialog to show selection
-                for widget in dialog.winfo_children():
-                    if isinstance(widget, ttk.Frame):
-                        for child in widget.winfo_children():
-                            if isinstance(child, ttk.Labelframe):
-                                # Look for the buttons_container frame
-                                for container in child.winfo_children():
-                                    if isinstance(container, ttk.Frame):
-                                        for btn in container.winfo_children():
-                                            if isinstance(btn, ttk.Button):
-                                                # Reset all buttons to outline
-                                                btn.configure(bootstyle="outline-primary")
-                                                # Highlight the selected one
-                                                if theme_name in btn.cget('text').lower():
-                                                    btn.configure(bootstyle="success")
+                for name, btn in self._theme_buttons.items():
+                    btn.configure(bootstyle="success" if name == theme_name else "outline-primary")
         except Exception as e:
             messagebox.showerror("Theme Error", f"Could not apply theme: {str(e)}")
 
@@ -946,56 +1222,75 @@ class RegenesisGUI:
         center_y = height // 2
 
         # Display welcome message
-        self.canvas.create_text(
-            center_x, center_y - 40,
+        self.canvas.coords(self._workspace_title, center_x, center_y - 40)
+        self.canvas.itemconfigure(
+            self._workspace_title,
             text="Welcome to ReGenesis",
             font=("Arial", 24, "bold"),
             fill="#2c3e50",
-            justify=tk.CENTER
+            state='normal'
         )
 
-        self.canvas.create_text(
-            center_x, center_y + 20,
+        self.canvas.coords(self._workspace_subtitle, center_x, center_y + 20)
+        self.canvas.itemconfigure(
+            self._workspace_subtitle,
             text="No projects loaded\n\nUse File → New to create a project\nor File → Open to load an existing one",
-            font=("Arial", 14),
-            fill="#7f8c8d",
-            justify=tk.CENTER
+            state='normal'
         )
 
-    def _populate_sample_tree(self):
-        """Populate the tree with sample design structure."""
-        # Root node - the project itself
-        # Project values: (type, latitude, longitude, width, length, units)
-        root = self.tree.insert('', 'end', text='Smith Residence',
-                               values=('project', '42.3601', '-71.0589', '100', '150', 'feet'),
-                               open=True, tags=('project',))
+    @contextmanager
+    def _batch_tree_updates(self):
+        """Unmap the tree during bulk changes so Tk lays it out and redraws once.
 
-        # Front yard - meadow region
-        # Region values: (type, region_type, soil_moisture, soil_type, sun)
-        front_yard = self.tree.insert(root, 'end', text='Front Yard',
-                                      values=('region', 'meadow', 'medium', 'loam', 'full-sun'),
-                                      tags=('region',))
-
-        # Side yard - layered region
-        side_yard = self.tree.insert(root, 'end', text='Side Yard',
-                                     values=('region', 'layered', 'med-dry', 'loam', 'part-sun'),
-                                     tags=('region',))
+        The tree is packed back with the options and stacking position it had.
+        """
+        tree = self.tree
+        pack_options = tree.pack_info()
+        siblings = tree.master.pack_slaves()
+        position = siblings.index(tree)
+        if position + 1 < len(siblings):
+            pack_options['before'] = siblings[position + 1]
+        tree.pack_forget()
+        try:
+            yield
+        finally:
+            tree.pack(pack_options)
 
-        # Backyard - container region with children
-        backyard = self.tree.insert(root, 'end', text='Backyard',
-                                   values=('region', 'meadow', 'medium', 'loam', 'full-sun'),
-                                   open=True, tags=('region',))
-
-        # Backyard children - nested regions
-        self.tree.insert(backyard, 'end', text='Pond',
-                        values=('region', 'pond', 'wet', 'clay', 'full-sun'),
-                        tags=('region',))
-        self.tree.insert(backyard, 'end', text='Woodland Edge',
-                        values=('region', 'layered', 'medium', 'loam', 'shade'),
-                        tags=('region',))
-        self.tree.insert(backyard, 'end', text='Patio',
-                        values=('region', 'patio/deck', 'dry', 'sand', 'full-sun'),
-                        tags=('region',))
+    def _populate_sample_tree(self):
+        """Populate the tree with sample design structure."""
+        with self._batch_tree_updates():
+            # Root node - the project itself
+            # Project values: (type, latitude, longitude, width, length, units)
+            root = self.tree.insert('', 'end', text='Smith Residence',
+                                   values=('project', '42.3601', '-71.0589', '100', '150', 'feet'),
+                                   open=True, tags=('project',))
+
+            # Front yard - meadow region
+            # Region values: (type, region_type, soil_moisture, soil_type, sun)
+            front_yard = self.tree.insert(root, 'end', text='Front Yard',
+                                          values=('region', 'meadow', 'medium', 'loam', 'full-sun'),
+                                          tags=('region',))
+
+            # Side yard - layered region
+            side_yard = self.tree.insert(root, 'end', text='Side Yard',
+                                         values=('region', 'layered', 'med-dry', 'loam', 'part-sun'),
+                                         tags=('region',))
+
+            # Backyard - container region with children
+            backyard = self.tree.insert(root, 'end', text='Backyard',
+                                       values=('region', 'meadow', 'medium', 'loam', 'full-sun'),
+                                       open=True, tags=('region',))
+
+            # Backyard children - nested regions
+            self.tree.insert(backyard, 'end', text='Pond',
+                            values=('region', 'pond', 'wet', 'clay', 'full-sun'),
+                            tags=('region',))
+            self.tree.insert(backyard, 'end', text='Woodland Edge',
+                            values=('region', 'layered', 'medium', 'loam', 'shade'),
+                            tags=('region',))
+            self.tree.insert(backyard, 'end', text='Patio',
+                            values=('region', 'patio/deck', 'dry', 'sand', 'full-sun'),
+                            tags=('region',))
 
         # Auto-select the project root to show the rectangle
         self.tree.selection_set(root)
@@ -1009,9 +1304,10 @@ class RegenesisGUI:
 
     def _on_tree_select(self, event):
         """Handle tree selection event."""
-        import time
-        start_time = time.time()
-        self._log_info("=== Tree select START ===")
+        profile = self._profile_enabled
+        if profile:
+            start_time = time.perf_counter()
+            self._log_info("=== Tree select START ===")
 
         # Save current polygon if in drawing mode
         if self.drawing_mode and self.selected_item and self.polygon_vertices:
@@ -1035,9 +1331,10 @@ class RegenesisGUI:
         item = selection[0]
         self.selected_item = item
 
-        # Get item details
-        item_text = self.tree.item(item, 'text')
-        item_values = self.tree.item(item, 'values')
+        # Get item details (all options in one call)
+        info = self.tree.item(item)
+        item_text = info['text']
+        item_values = info['values']
 
         # Determine item type
         item_type = item_values[0] if item_values and len(item_values) > 0 else 'project'
@@ -1045,44 +1342,53 @@ class RegenesisGUI:
         # Update properties panel based on type
         self._updating_properties = True
 
-        # Hide both forms first
-        self.project_props_frame.pack_forget()
-        self.region_props_frame.pack_forget()
+        # Hide both forms first (either may not have been built yet)
+        for frame in (self.project_props_frame, self.region_props_frame):
+            if frame is not None:
+                frame.pack_forget()
 
         if item_type == 'project':
             # Show project properties form
-            self.project_props_frame.pack(fill=tk.BOTH, expand=True)
+            self._ensure_project_props_frame().pack(fill=tk.BOTH, expand=True)
 
             # Load project properties
-            self.project_name_var.set(item_text)
-            self.project_latitude_var.set(item_values[1] if len(item_values) > 1 else '')
-            self.project_longitude_var.set(item_values[2] if len(item_values) > 2 else '')
-            self.project_width_var.set(item_values[3] if len(item_values) > 3 else '')
-            self.project_length_var.set(item_values[4] if len(item_values) > 4 else '')
-            self.project_units_var.set(item_values[5] if len(item_values) > 5 else 'feet')
+            self._set_form_var(self.project_name_var, item_text)
+            self._set_form_var(self.project_latitude_var, item_values[1] if len(item_values) > 1 else '')
+            self._set_form_var(self.project_longitude_var, item_values[2] if len(item_values) > 2 else '')
+            self._set_form_var(self.project_width_var, item_values[3] if len(item_values) > 3 else '')
+            self._set_form_var(self.project_length_var, item_values[4] if len(item_values) > 4 else '')
+            self._set_form_var(self.project_units_var, item_values[5] if len(item_values) > 5 else 'feet')
 
         elif item_type == 'region':
             # Show region properties form
-            self.region_props_frame.pack(fill=tk.BOTH, expand=True)
+            self._ensure_region_props_frame().pack(fill=tk.BOTH, expand=True)
 
             # Load region properties
-            self.region_name_var.set(item_text)
-            self.region_type_var.set(item_values[1] if len(item_values) > 1 else 'meadow')
-            self.soil_moisture_var.set(item_values[2] if len(item_values) > 2 else 'medium')
-            self.soil_type_var.set(item_values[3] if len(item_values) > 3 else 'loam')
-            self.sun_var.set(item_values[4] if len(item_values) > 4 else 'full-sun')
+            self._set_form_var(self.region_name_var, item_text)
+            self._set_form_var(self.region_type_var, item_values[1] if len(item_values) > 1 else 'meadow')
+            self._set_form_var(self.soil_moisture_var, item_values[2] if len(item_values) > 2 else 'medium')
+            self._set_form_var(self.soil_type_var, item_values[3] if len(item_values) > 3 else 'loam')
+            self._set_form_var(self.sun_var, item_values[4] if len(item_values) > 4 else 'full-sun')
 
         self._updating_properties = False
 
         # Update workspace canvas
-        before_workspace = time.time()
+        if profile:
+            before_workspace = time.perf_counter()
         self._update_workspace(item_text, item_type)
-        after_workspace = time.time()
 
-        self._log_info(f"_update_workspace took {(after_workspace - before_workspace)*1000:.0f}ms")
+        if profile:
+            after_workspace = time.perf_counter()
+            self._log_info(f"_update_workspace took {(after_workspace - before_workspace)*1000:.0f}ms")
+            total_elapsed = after_workspace - start_time
+            self._log_info(f"=== Tree select COMPLETE: {total_elapsed*1000:.0f}ms ===")
 
-        total_elapsed = time.time() - start_time
-        self._log_info(f"=== Tree select COMPLETE: {total_elapsed*1000:.0f}ms ===")
+    def _set_form_var(self, var, value):
+        """Set a form variable, skipping the write (and the widget redraw it
+        triggers) when it already holds that value."""
+        # Tree values can come back from ttk as numbers; the variable holds text
+        if var.get() != str(value):
+            var.set(value)
 
     def _apply_property_change(self):
         """Apply property changes to the selected tree item."""
@@ -1091,9 +1397,17 @@ class RegenesisGUI:
 
         try:
             # Get current item type
-            item_values = self.tree.item(self.selected_item, 'values')
+            info = self.tree.item(self.selected_item)
+            item_values = info['values']
             item_type = item_values[0] if item_values and len(item_values) > 0 else 'project'
 
+            # Nothing to apply if this type's form hasn't been built yet
+            # (e.g. a FocusOut after a right-click moved selected_item)
+            if item_type == 'project' and self.project_props_frame is None:
+                return
+            if item_type == 'region' and self.region_props_frame is None:
+                return
+
             if item_type == 'project':
                 # Update project properties
                 name = self.project_name_var.get().strip()
@@ -1102,11 +1416,7 @@ class RegenesisGUI:
                 width = self.project_width_var.get().strip()
                 length = self.project_length_var.get().strip()
                 units = self.project_units_var.get()
-
-                # Update tree item
-                if name:
-                    self.tree.item(self.selected_item, text=name)
-                self.tree.item(self.selected_item, values=('project', latitude, longitude, width, length, units))
+                new_values = ('project', latitude, longitude, width, length, units)
 
             elif item_type == 'region':
                 # Update region properties
@@ -1115,40 +1425,59 @@ class RegenesisGUI:
                 soil_moisture = self.soil_moisture_var.get()
                 soil_type = self.soil_type_var.get()
                 sun = self.sun_var.get()
+                new_values = ('region', region_type, soil_moisture, soil_type, sun)
+
+            else:
+                return
 
-                # Update tree item
-                if name:
-                    self.tree.item(self.selected_item, text=name)
-                self.tree.item(self.selected_item, values=('region', region_type, soil_moisture, soil_type, sun))
+            # Return and FocusOut both apply the form, and FocusOut fires on
+            # every focus change. Skip the tree write and the canvas redraw
+            # when nothing was actually edited.
+            item_text = str(info['text'])
+            if (not name or name == item_text) and tuple(map(str, item_values)) == new_values:
+                return
+
+            # Update tree item
+            if name:
+                self.tree.item(self.selected_item, text=name)
+                item_text = name
+            self.tree.item(self.selected_item, values=new_values)
 
             # Update workspace
-            item_text = self.tree.item(self.selected_item, 'text')
             self._update_workspace(item_text, item_type)
 
         except Exception as e:
             self._log_error(f"Failed to apply property change: {e}")
 
-    def _update_workspace(self, name, item_type, retry_count=0):
+    def _get_canvas_size(self):
+        """Return the canvas (width, height) from its last <Configure>.
+
+        Only forces a layout pass with update_idletasks() if the canvas
+        hasn't been configured yet.
+        """
+        if self._canvas_size is not None:
+            return self._canvas_size
+        self.canvas.update_idletasks()
+        return self.canvas.winfo_width(), self.canvas.winfo_height()
+
+    def _update_workspace(self, name, item_type):
         """Update the workspace canvas to display the selected item."""
-        import time
-        ws_start = time.time()
+        if self._profile_enabled:
+            ws_start = time.perf_counter()
 
-        # Clear canvas
-        self.canvas.delete('all')
+        # Clear canvas, keeping the retained message items (just hidden)
+        self.canvas.delete('!message')
+        self.canvas.itemconfigure('message', state='hidden')
 
         # Get canvas dimensions
-        self.canvas.update_idletasks()
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        width, height = self._get_canvas_size()
 
-        # Check if canvas is properly sized, if not skip this update
+        # If the canvas isn't sized yet, _on_canvas_resize runs this update
+        # when its first real <Configure> arrives
         if width < 10 or height < 10:
-            if retry_count < 50:  # Limit retries to prevent infinite loop
-                # Try again in 100ms
-                self.root.after(100, lambda: self._update_workspace(name, item_type, retry_count + 1))
-            else:
-                self._log_error(f"Canvas failed to size properly after {retry_count} retries")
+            self._pending_workspace = (name, item_type)
             return
+        self._pending_workspace = None
 
         center_x = width / 2
         center_y = height / 2
@@ -1190,8 +1519,9 @@ class RegenesisGUI:
                 self._create_default_rectangle()
                 self._log_info("Drawing mode enabled - rectangle created for region")
 
-        ws_elapsed = time.time() - ws_start
-        self._log_info(f"Update workspace completed in {ws_elapsed*1000:.1f}ms")
+        if self._profile_enabled:
+            ws_elapsed = time.perf_counter() - ws_start
+            self._log_info(f"Update workspace completed in {ws_elapsed*1000:.1f}ms")
 
     def _start_tree_rename(self, event):
         """Start in-tree renaming (double-click on item)."""
@@ -1211,14 +1541,8 @@ class RegenesisGUI:
             self.tree.selection_set(item)
             self.selected_item = item
 
-            # Create context menu
-            menu = tk.Menu(self.root, tearoff=0)
-            menu.add_command(label="Add Child Region", command=self._add_child_region)
-            menu.add_separator()
-            menu.add_command(label="Delete", command=self._delete_item)
-
             # Show menu at cursor position
-            menu.post(event.x_root, event.y_root)
+            self._context_menu.post(event.x_root, event.y_root)
 
     def _add_child_region(self):
         """Add a new child region to the selected item."""
@@ -1271,26 +1595,44 @@ class RegenesisGUI:
 
     def _show_delete_confirmation(self, title, message):
         """Show custom delete confirmation dialog with Proceed and Cancel buttons."""
-        dialog = tk.Toplevel(self.root)
+        # The dialog is built on first use, then hidden and re-shown
+        if self._delete_dialog is None:
+            self._build_delete_dialog()
+        dialog = self._delete_dialog
+
         dialog.title(title)
-        dialog.geometry("450x180")
-        dialog.transient(self.root)
+        self._delete_message.configure(text=message)
+        self._delete_choice.set('')
+
+        dialog.deiconify()
         dialog.grab_set()
+        dialog.wait_variable(self._delete_choice)
+        dialog.grab_release()
+        dialog.withdraw()
+        return self._delete_choice.get() == 'proceed'
+
+    def _build_delete_dialog(self):
+        """Create the (hidden) delete confirmation dialog."""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.transient(self.root)
 
         # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 450) // 2
-        y = (dialog.winfo_screenheight() - 180) // 2
+        x = (self._screen_width - 450) // 2
+        y = (self._screen_height - 180) // 2
         dialog.geometry(f"450x180+{x}+{y}")
 
-        result = {'proceed': False}
+        # Set by the buttons (or closing the window); the dialog waits on it
+        self._delete_choice = tk.StringVar(dialog)
+        dialog.protocol('WM_DELETE_WINDOW', lambda: self._delete_choice.set('cancel'))
 
         # Main frame with padding
         main_frame = ttk.Frame(dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Message
-        ttk.Label(main_frame, text=message, wraplength=400, font=("Helvetica", 11)).pack(pady=(0, 20))
+        self._delete_message = ttk.Label(main_frame, wraplength=400, font=("Helvetica", 11))
+        self._delete_message.pack(pady=(0, 20))
 
         # Button frame
         btn_frame = ttk.Frame(main_frame)
@@ -1302,7 +1644,7 @@ class RegenesisGUI:
             text="Proceed",
             width=12,
             bootstyle="danger",
-            command=lambda: [result.update({'proceed': True}), dialog.destroy()]
+            command=lambda: self._delete_choice.set('proceed')
         )
         proceed_btn.pack(side=tk.LEFT, padx=10)
 
@@ -1312,12 +1654,11 @@ class RegenesisGUI:
             text="Cancel",
             width=12,
             bootstyle="secondary",
-            command=dialog.destroy
+            command=lambda: self._delete_choice.set('cancel')
         )
         cancel_btn.pack(side=tk.LEFT, padx=10)
 
-        dialog.wait_window()
-        return result['proceed']
+        self._delete_dialog = dialog
 
     def _on_drag_start(self, event):
         """Handle start of drag operation."""
@@ -1333,6 +1674,32 @@ class RegenesisGUI:
                 self._drag_item = None
                 return
             self._drag_item = item
+            # The tree doesn't change during a drag, so read item types once
+            self._drag_type = (self.tree.item(item, 'values') or (None,))[0]
+            self._motion_type_cache = {}
+            self._drag_selection = None
+            self._hover_target = None
+            self._hover_bbox = None
+
+    def _on_tree_yscroll(self, first, last):
+        """Update the tree scrollbar and drop the cached hover bbox (the rows moved)."""
+        self._tree_scroll.set(first, last)
+        self._hover_target = None
+        self._hover_bbox = None
+
+    def _queue_drag_motion(self, event):
+        """Coalesce motion events so drag feedback runs at most once per frame."""
+        self._last_motion_event = event
+        if self._motion_after_id is None:
+            self._motion_after_id = self.root.after(DRAG_MOTION_INTERVAL_MS, self._process_drag_motion)
+
+    def _process_drag_motion(self):
+        """Run the drag feedback for the most recent queued motion event."""
+        self._motion_after_id = None
+        event = self._last_motion_event
+        self._last_motion_event = None
+        if event is not None:
+            self._on_drag_motion(event)
 
     def _on_drag_motion(self, event):
         """Handle drag motion - visual feedback."""
@@ -1341,45 +1708,60 @@ class RegenesisGUI:
 
         # Check if the mouse has moved enough to be considered a drag
         # Use a 5-pixel threshold to distinguish from clicks
-        dx = abs(event.x - self._drag_start_x)
-        dy = abs(event.y - self._drag_start_y)
-        if dx > 5 or dy > 5:
+        if not self._has_moved:
+            dx = abs(event.x - self._drag_start_x)
+            dy = abs(event.y - self._drag_start_y)
+            # Only show drag feedback if we've actually moved
+            if dx <= 5 and dy <= 5:
+                return
             self._has_moved = True
+            # The drag has really started: collect the rows it can't be dropped
+            # on now, so plain clicks never walk the subtree
+            self._drag_subtree = self._collect_subtree(self._drag_item)
 
-        # Only show drag feedback if we've actually moved
-        if not self._has_moved:
-            return
+        # This runs for every motion event, so keep the lookups in locals.
+        # The setters skip the Tk call when nothing changed.
+        tree = self.tree
+        set_cursor = self._set_tree_cursor
+        select = self._select_drop_target
 
         # Get the item under the cursor
-        target = self.tree.identify_row(event.y)
+        target = tree.identify_row(event.y)
         if not target:
             self._drop_target = None
             self._drop_position = None
-            self.tree.config(cursor='')
+            set_cursor('')
             # Clear any previous visual feedback
-            self.tree.selection_set(self._drag_item)
+            select(self._drag_item)
             return
 
         # Don't allow dropping on itself or descendants
-        if target == self._drag_item or self._is_descendant(self._drag_item, target):
+        if target in self._drag_subtree:
             self._drop_target = None
             self._drop_position = None
-            self.tree.config(cursor='X_cursor')  # Cross-platform "not allowed" cursor
+            set_cursor('X_cursor')  # Cross-platform "not allowed" cursor
             return
 
-        # Get the bounding box of the target item
-        bbox = self.tree.bbox(target)
+        # Get the bounding box of the target item. Reuse it while the pointer
+        # stays on the same row; _on_tree_yscroll clears it when the tree scrolls.
+        if target == self._hover_target:
+            bbox = self._hover_bbox
+        else:
+            bbox = tree.bbox(target)
+            self._hover_target = target
+            self._hover_bbox = bbox
         if not bbox:
             return
 
         _, item_y, _, item_height = bbox
         relative_y = event.y - item_y
 
-        # Get drag and target types
-        drag_values = self.tree.item(self._drag_item, 'values')
-        drag_type = drag_values[0] if drag_values else None
-        target_values = self.tree.item(target, 'values')
-        target_type = target_values[0] if target_values else None
+        # Look up the target's type once per drag
+        type_cache = self._motion_type_cache
+        if target in type_cache:
+            target_type = type_cache[target]
+        else:
+            target_type = type_cache[target] = (tree.item(target, 'values') or (None,))[0]
 
         # Determine drop position based on cursor position within the item
         # Top quarter = above, bottom quarter = below, middle = inside (if applicable)
@@ -1389,30 +1771,48 @@ class RegenesisGUI:
             # Top quarter - drop above
             self._drop_position = 'above'
             self._drop_target = target
-            self.tree.selection_set(target)
-            self.tree.config(cursor='based_arrow_up')
+            select(target)
+            set_cursor('based_arrow_up')
         elif relative_y > 3 * quarter:
             # Bottom quarter - drop below
             self._drop_position = 'below'
             self._drop_target = target
-            self.tree.selection_set(target)
-            self.tree.config(cursor='based_arrow_down')
+            select(target)
+            set_cursor('based_arrow_down')
         else:
             # Middle half - drop inside (only for regions and projects)
-            if drag_type == 'region' and target_type in ('project', 'region'):
+            if self._drag_type == 'region' and target_type in ('project', 'region'):
                 self._drop_position = 'inside'
                 self._drop_target = target
-                self.tree.selection_set(target)
-                self.tree.config(cursor='hand2')
+                select(target)
+                set_cursor('hand2')
             else:
                 # Can't drop inside, default to below
                 self._drop_position = 'below'
                 self._drop_target = target
-                self.tree.selection_set(target)
-                self.tree.config(cursor='based_arrow_down')
+                select(target)
+                set_cursor('based_arrow_down')
+
+    def _set_tree_cursor(self, cursor):
+        """Set the tree's cursor, skipping the Tk call if it's already set."""
+        if cursor != self._tree_cursor:
+            self.tree.config(cursor=cursor)
+            self._tree_cursor = cursor
+
+    def _select_drop_target(self, item):
+        """Highlight a drop target, skipping the Tk call if it's already selected."""
+        if item != self._drag_selection:
+            self.tree.selection_set(item)
+            self._drag_selection = item
 
     def _on_drag_release(self, event):
         """Handle drop operation."""
+        # Apply any motion still waiting on the throttle so the drop uses
+        # the target under the cursor at release time
+        if self._motion_after_id is not None:
+            self.root.after_cancel(self._motion_after_id)
+            self._process_drag_motion()
+
         if not self._drag_item:
             return
 
@@ -1438,20 +1838,25 @@ class RegenesisGUI:
                 self._drop_position = None
                 return
 
-            # Perform the drop based on position
-            if position == 'above':
-                # Insert above target (as sibling before target)
-                target_parent = self.tree.parent(target)
-                target_index = self.tree.index(target)
-                new_item = self._clone_subtree(self._drag_item, target_parent, target_index)
-            elif position == 'below':
-                # Insert below target (as sibling after target)
+            # Perform the drop based on position. move() relocates the item
+            # with its whole subtree in one call, and keeps its item ID (so
+            # region_polygons entries stay attached to it).
+            moved_item = self._drag_item
+            if position in ('above', 'below'):
+                # Move as a sibling before/after target. move() counts the
+                # index without the moved item, so a forward move within the
+                # same parent has one sibling fewer ahead of the target.
                 target_parent = self.tree.parent(target)
                 target_index = self.tree.index(target)
-                new_item = self._clone_subtree(self._drag_item, target_parent, target_index + 1)
+                if (self.tree.parent(moved_item) == target_parent
+                        and self.tree.index(moved_item) < target_index):
+                    target_index -= 1
+                if position == 'below':
+                    target_index += 1
+                self.tree.move(moved_item, target_parent, target_index)
             elif position == 'inside':
-                # Insert inside target (as last child)
-                new_item = self._clone_subtree(self._drag_item, target, 'end')
+                # Move inside target (as last child)
+                self.tree.move(moved_item, target, 'end')
                 self.tree.item(target, open=True)  # Expand target
             else:
                 # Shouldn't happen, but fallback
@@ -1460,106 +1865,102 @@ class RegenesisGUI:
                 self._drop_position = None
                 return
 
-            # Delete the old item
-            self.tree.delete(self._drag_item)
-
-            # Select the new item
-            self.tree.selection_set(new_item)
-            self.tree.see(new_item)
-            self.selected_item = new_item
+            # Select the moved item
+            self.tree.selection_set(moved_item)
+            self.tree.see(moved_item)
+            self.selected_item = moved_item
 
         # Reset cursor
-        self.tree.config(cursor='')
+        self._set_tree_cursor('')
 
         # Reset drag state
         self._drag_item = None
         self._drop_target = None
         self._drop_position = None
         self._has_moved = False
-
-    def _is_descendant(self, parent_item, child_item):
-        """Check if child_item is a descendant of parent_item."""
-        current = child_item
-        while current:
-            if current == parent_item:
-                return True
-            current = self.tree.parent(current)
-        return False
-
-    def _clone_subtree(self, item, new_parent, index):
-        """Clone an item and all its children to a new location."""
-        # Get item data
-        text = self.tree.item(item, 'text')
-        values = self.tree.item(item, 'values')
-        open_state = self.tree.item(item, 'open')
-        tags = self.tree.item(item, 'tags')
-
-        # Insert the new item
-        new_item = self.tree.insert(new_parent, index, text=text, values=values, open=open_state, tags=tags)
-
-        # Clone all children recursively
-        for child in self.tree.get_children(item):
-            self._clone_subtree(child, new_item, 'end')
-
-        return new_item
+        self._motion_type_cache.clear()
+        self._drag_subtree = set()
+
+    def _collect_subtree(self, item):
+        """Return a set of item and all of its descendants."""
+        subtree = {item}
+        stack = [item]
+        get_children = self.tree.get_children
+        while stack:
+            children = get_children(stack.pop())
+            subtree.update(children)
+            stack.extend(children)
+        return subtree
 
     def _save_tree_to_file(self, filepath):
         """Save the tree structure to a JSON file."""
-        import json
-
-        def serialize_item(item_id):
-            """Recursively serialize a tree item and its children."""
+        # Imported here, not at module level, so loading this module doesn't
+        # pull in the app model (it's imported on the startup worker thread)
+        from regenesis import dumps_json
+
+        # Walk the tree depth-first with an explicit stack (no recursion, so
+        # deep trees can't hit the recursion limit). Each entry pairs an item
+        # with the list its serialized form is appended to; children are
+        # pushed in reverse so they pop, and are appended, in order.
+        tree = self.tree
+        get_children = tree.get_children
+        call = tree.tk.call
+        splitlist = tree.tk.splitlist
+        root_items = []  # The root items (should be just the project)
+        stack = [(item_id, root_items) for item_id in reversed(get_children(''))]
+        while stack:
+            item_id, siblings = stack.pop()
+            # Fetch all of the item's options in one Tcl call. The raw option
+            # list keeps values exactly as stored; tree.item() with no option
+            # would have ttk convert numeric-looking strings to ints.
+            options = call(tree, 'item', item_id)
+            info = dict(zip(map(str, options[::2]), options[1::2]))
             item_data = {
-                'text': self.tree.item(item_id, 'text'),
-                'values': list(self.tree.item(item_id, 'values')),
-                'tags': list(self.tree.item(item_id, 'tags')),
+                'text': str(info['-text']),
+                'values': [str(value) for value in splitlist(info['-values'])],
+                'tags': [str(tag) for tag in splitlist(info['-tags'])],
                 'children': []
             }
-            for child_id in self.tree.get_children(item_id):
-                item_data['children'].append(serialize_item(child_id))
-            return item_data
-
-        # Get the root items (should be just the project)
-        root_items = []
-        for item_id in self.tree.get_children(''):
-            root_items.append(serialize_item(item_id))
+            siblings.append(item_data)
+            stack.extend((child_id, item_data['children'])
+                         for child_id in reversed(get_children(item_id)))
 
         # Save to file
+        # Serialize up front and hand the file one buffer instead of
+        # json.dump's stream of small writes
         project_data = {'tree': root_items}
-        with open(filepath, 'w') as f:
-            json.dump(project_data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dumps_json(project_data))
 
     def _load_tree_from_file(self, filepath):
         """Load the tree structure from a JSON file."""
         import json
 
-        def deserialize_item(item_data, parent=''):
-            """Recursively deserialize a tree item and its children."""
-            # Insert the item
-            item_id = self.tree.insert(
-                parent,
-                'end',
-                text=item_data['text'],
-                values=tuple(item_data['values']),
-                tags=tuple(item_data['tags']),
-                open=True
-            )
-            # Insert children
-            for child_data in item_data.get('children', []):
-                deserialize_item(child_data, item_id)
-            return item_id
-
         # Load from file
         with open(filepath, 'r') as f:
             project_data = json.load(f)
 
-        # Clear existing tree
-        for item in self.tree.get_children(''):
-            self.tree.delete(item)
-
-        # Load tree items
-        for item_data in project_data.get('tree', []):
-            deserialize_item(item_data)
+        with self._batch_tree_updates():
+            # Clear existing tree
+            for item in self.tree.get_children(''):
+                self.tree.delete(item)
+
+            # Load tree items depth-first with an explicit stack. Children
+            # are pushed in reverse so they pop, and are appended, in order.
+            insert = self.tree.insert
+            stack = [(item_data, '') for item_data in reversed(project_data.get('tree', []))]
+            while stack:
+                item_data, parent = stack.pop()
+                # Only pass values/tags when there are some; empty ones are
+                # the widget default and just lengthen the Tcl command.
+                options = {'text': item_data['text'], 'open': True}
+                if item_data['values']:
+                    options['values'] = tuple(item_data['values'])
+                if item_data['tags']:
+                    options['tags'] = tuple(item_data['tags'])
+                item_id = insert(parent, 'end', **options)
+                stack.extend((child_data, item_id)
+                             for child_data in reversed(item_data.get('children', [])))
 
     def _log_info(self, message):
         """Log an info message to the console."""
@@ -1611,26 +2012,44 @@ class RegenesisGUI:
 
     def _create_tooltip(self, widget, text):
         """Create a tooltip for a widget."""
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, background="#ffffe0", relief=tk.SOLID, borderwidth=1, font=("Arial", 9))
-            label.pack()
-            widget._tooltip = tooltip
-
-        def on_leave(event):
-            if hasattr(widget, '_tooltip'):
-                widget._tooltip.destroy()
-                del widget._tooltip
-
-        widget.bind('<Enter>', on_enter)
-        widget.bind('<Leave>', on_leave)
+        # Every tooltip widget shares one bindtag (per window, since class
+        # bindings are shared by every window in this interpreter)
+        if not self._tooltips:
+            self.root.bind_class(self._tooltip_tag, '<Enter>', self._show_tooltip)
+            self.root.bind_class(self._tooltip_tag, '<Leave>', self._hide_tooltip)
+        self._tooltips[str(widget)] = text
+        widget.bindtags((self._tooltip_tag,) + widget.bindtags())
+
+    def _show_tooltip(self, event):
+        """Show the shared tooltip window next to the hovered widget."""
+        if self._tooltip_window is None:
+            self._tooltip_window = tk.Toplevel(self.root)
+            self._tooltip_window.wm_overrideredirect(True)
+            self._tooltip_label = tk.Label(self._tooltip_window, background="#ffffe0", relief=tk.SOLID, borderwidth=1, font=("Arial", 9))
+            self._tooltip_label.pack()
+        self._tooltip_label.configure(text=self._tooltips[str(event.widget)])
+        self._tooltip_window.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        self._tooltip_window.deiconify()
+        self._tooltip_window.lift()
+
+    def _hide_tooltip(self, event):
+        """Hide the shared tooltip window."""
+        if self._tooltip_window is not None:
+            self._tooltip_window.withdraw()
 
     # Canvas Pan/Zoom Methods
 
-    def _on_canvas_resize(self):
+    def _on_canvas_resize(self, event=None):
         """Handle canvas resize - update rulers and reposition project items."""
+        if event is not None:
+            self._canvas_size = (event.width, event.height)
+
+        # Run a workspace update that was waiting for the canvas to be sized
+        # (it redraws everything, rulers included)
+        if self._pending_workspace is not None and event is not None and event.width >= 10 and event.height >= 10:
+            self._update_workspace(*self._pending_workspace)
+            return
+
         # Update rulers (which also redraws origin marker)
         self._update_rulers()
 
@@ -1752,35 +2171,43 @@ class RegenesisGUI:
 
     def _draw_all_region_polygons(self):
         """Draw all saved region polygons (non-editable display)."""
+        # One create call per polygon and per vertex, so keep the lookups in
+        # locals. Vertices are small circles, max 10 pixels, scaled down with zoom.
+        create_polygon = self.canvas.create_polygon
+        create_oval = self.canvas.create_oval
+        vertex_radius = min(10, max(3, 10 * self.canvas_zoom))
+        skip_item = self.selected_item if self.drawing_mode else None
+
         for region_item, vertices in self.region_polygons.items():
             # Skip the currently selected region if in drawing mode (it will be drawn editable)
-            if self.drawing_mode and region_item == self.selected_item:
+            if region_item == skip_item:
                 continue
 
             if len(vertices) < 3:
                 continue
 
+            tag = f'region_polygon_{region_item}'
+
             # Draw the filled polygon
             flat_coords = [coord for vertex in vertices for coord in vertex]
-            self.canvas.create_polygon(
+            create_polygon(
                 flat_coords,
                 fill='#2ecc71',
                 outline='#27ae60',
                 width=2,
                 stipple='gray25',
-                tags=f'region_polygon_{region_item}'
+                tags=tag
             )
 
-            # Draw vertices (small circles, max 10 pixels, scale down with zoom)
-            vertex_radius = min(10, max(3, 10 * self.canvas_zoom))
+            # Draw vertices
             for vx, vy in vertices:
-                self.canvas.create_oval(
+                create_oval(
                     vx - vertex_radius, vy - vertex_radius,
                     vx + vertex_radius, vy + vertex_radius,
                     fill='#27ae60',
                     outline='#1e8449',
                     width=1,
-                    tags=f'region_polygon_{region_item}'
+                    tags=tag
                 )
 
     def _redraw_project_rectangle(self, project_width, project_length):
@@ -1918,9 +2345,7 @@ class RegenesisGUI:
     def _fit_to_project_rectangle(self, project_width, project_length):
         """Fit the canvas view to show the project rectangle."""
         # Get canvas dimensions
-        self.canvas.update_idletasks()
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self._get_canvas_size()
 
         # Calculate required dimensions with 20% margin
         required_width_units = project_width * 1.2
@@ -1984,9 +2409,7 @@ class RegenesisGUI:
         poly_center_y = (min_y + max_y) / 2
 
         # Get canvas dimensions
-        self.canvas.update_idletasks()
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self._get_canvas_size()
         canvas_center_x = canvas_width / 2
         canvas_center_y = canvas_height / 2
 
@@ -2114,9 +2537,7 @@ class RegenesisGUI:
     def _create_default_rectangle(self):
         """Create a default rectangle in the center of the canvas."""
         # Get canvas center
-        self.canvas.update_idletasks()
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        width, height = self._get_canvas_size()
         center_x = width / 2
         center_y = height / 2
 
@@ -2559,4 +2980,7 @@ class RegenesisGUI:
 
     def run(self):
         """Start the GUI application."""
+        # Settle pending geometry before entering the loop so the first
+        # events aren't queued behind the initial layout of the main window.
+        self.root.update_idletasks()
         self.root.mainloop()
@@ -4,7 +4,12 @@ This test suite validates core functionality to catch regressions when making ch
 Run with: python3 regenesis_gui_test.py
 """
 
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
 import tkinter as tk
 import ttkbootstrap as ttk
 from regenesis_gui import RegenesisGUI
@@ -53,6 +58,57 @@ class TestPreferencesManager(unittest.TestCase):
         self.prefs.set('location.latitude', 40.7128)
         self.assertEqual(self.prefs.get('location.latitude'), 40.7128)
 
+    def test_flush_writes_pending_changes(self):
+        """Test that set() is kept in memory until flush() writes it to disk."""
+        with tempfile.TemporaryDirectory() as home:
+            with mock.patch.dict(os.environ, {'HOME': home}):
+                prefs = PreferencesManager()
+                prefs.set_theme('darkly')
+                self.assertEqual(PreferencesManager().get_theme(), 'flatly')
+
+                prefs.flush()
+                self.assertEqual(PreferencesManager().get_theme(), 'darkly')
+
+    def test_stored_value_clashing_with_default_section_is_dropped(self):
+        """Test that a file value shaped unlike the defaults can't break saving."""
+        import json
+
+        with tempfile.TemporaryDirectory() as home:
+            with mock.patch.dict(os.environ, {'HOME': home}):
+                prefs_dir = os.path.join(home, '.regenesis')
+                os.makedirs(prefs_dir)
+                with open(os.path.join(prefs_dir, 'preferences.json'), 'w') as f:
+                    json.dump({'location': 'x', 'theme': 'darkly'}, f)
+
+                prefs = PreferencesManager()
+                self.assertIsNone(prefs.get('location'))
+                self.assertEqual(prefs.get_theme(), 'darkly')
+
+                prefs.set_location(42.3601, -71.0589)
+                prefs.flush()
+                reloaded = PreferencesManager()
+                self.assertEqual(reloaded.get_location(), (42.3601, -71.0589))
+                self.assertEqual(reloaded.get_theme(), 'darkly')
+
+    def test_exit_flush_skips_dropped_managers(self):
+        """Test that the exit hook writes live managers but not dropped ones."""
+        import gc
+        import preferences_manager
+
+        with tempfile.TemporaryDirectory() as home:
+            with mock.patch.dict(os.environ, {'HOME': home}):
+                stale = PreferencesManager()
+                stale.set_theme('darkly')
+                del stale
+                gc.collect()
+                preferences_manager._flush_live_managers()
+                self.assertEqual(PreferencesManager().get_theme(), 'flatly')
+
+                prefs = PreferencesManager()
+                prefs.set_theme('superhero')
+                preferences_manager._flush_live_managers()
+                self.assertEqual(PreferencesManager().get_theme(), 'superhero')
+
 
 class TestRegenesisGUIBasics(unittest.TestCase):
     """Test basic ReGenesis GUI functionality without showing window."""
@@ -373,6 +429,27 @@ class TestPerformance(unittest.TestCase):
         root.destroy()
 
 
+class TestMainEntryPoint(unittest.TestCase):
+    """Test the main.py entry point."""
+
+    def test_import_does_not_load_tk(self):
+        """Test that importing main doesn't pull in Tk or open a window."""
+        code = "import sys, main; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_main_builds_and_runs_gui(self):
+        """Test that main() creates the GUI once and enters its event loop."""
+        import main
+        with mock.patch.object(main, 'RegenesisGUI') as gui_class:
+            main.main()
+        gui_class.assert_called_once_with()
+        gui_class.return_value.when_started.assert_called_once_with(main.gc.freeze)
+        gui_class.return_value.run.assert_called_once_with()
+
+
 def run_tests():
     """Run all tests and display results."""
     # Create test suite
@@ -386,6 +463,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPolygonOperations))
     suite.addTests(loader.loadTestsFromTestCase(TestAutoZoom))
     suite.addTests(loader.loadTestsFromTestCase(TestPerformance))
+    suite.addTests(loader.loadTestsFromTestCase(TestMainEntryPoint))
 
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2)
@@ -42,6 +42,7 @@ class TestRegenesisGUIIntegration(unittest.TestCase):
         # Set preferences to development mode for testing
         self.prefs = PreferencesManager()
         self.prefs.set_development_mode(True)
+        self.prefs.flush()  # The GUI reads its own PreferencesManager from disk
 
         # GUI instance will be created in each test
         self.gui = None
@@ -91,11 +92,13 @@ class TestRegenesisGUIIntegration(unittest.TestCase):
         """Helper to create GUI instance for testing."""
         self.gui = RegenesisGUI()
 
-        # The GUI __init__ shows the window at the end via _finish_startup
-        # which is scheduled via after() with up to 2 seconds delay for splash screen
-        # We need to wait for that callback to execute and window to be shown
+        # These tests run in development mode, which skips the splash: __init__
+        # builds the model itself and shows the window via _finish_startup.
+        # (Outside development mode that happens in an after() callback once
+        # the background model load is done and the splash has been up for
+        # SPLASH_MIN_VISIBLE.)
 
-        # Wait long enough for splash screen (2+ seconds) plus a bit extra
+        # Give the window manager time to map the window
         time.sleep(2.2)
 
         # Process all pending events (including the splash finish callback)
@@ -407,6 +410,122 @@ class TestRegenesisGUIIntegration(unittest.TestCase):
             # Restore original show_window setting
             self.show_window = original_show_window
 
+    def test_13_new_window_opens_in_process(self):
+        """Test that File > New Window opens a Toplevel in this process."""
+        gui = self._create_gui()
+
+        before = set(gui.root.winfo_children())
+        gui._new_window()
+        gui.root.update()
+
+        new_windows = [w for w in gui.root.winfo_children()
+                       if w not in before and w.winfo_class() == 'Toplevel']
+        self.assertEqual(len(new_windows), 1, "New Window should open one Toplevel")
+        self.assertTrue(new_windows[0].winfo_viewable(), "New window should be shown")
+
+        print("✓ New window opened in-process")
+
+    def test_14_properties_forms_built_on_selection(self):
+        """Test that each properties form is built when its item type is first selected."""
+        gui = self._create_gui()
+
+        project = gui.tree.get_children()[0]
+        gui.tree.selection_set(project)
+        gui._on_tree_select(None)
+        gui.root.update()
+
+        self.assertIsNotNone(gui.project_props_frame, "Project form should be built")
+        self.assertEqual(gui.project_props_frame.winfo_manager(), 'pack', "Project form should be shown")
+        self.assertIsNone(gui.region_props_frame, "Region form should not be built yet")
+
+        region = gui.tree.get_children(project)[0]
+        gui.tree.selection_set(region)
+        gui._on_tree_select(None)
+        gui.root.update()
+
+        self.assertIsNotNone(gui.region_props_frame, "Region form should be built")
+        self.assertEqual(gui.region_props_frame.winfo_manager(), 'pack', "Region form should be shown")
+        self.assertEqual(gui.project_props_frame.winfo_manager(), '', "Project form should be hidden")
+
+        print("✓ Properties forms built on first selection")
+
+    def _drop(self, gui, item, target, position):
+        """Drop item on target as if it had been dragged there."""
+        gui._drag_item = item
+        gui._drop_target = target
+        gui._drop_position = position
+        gui._has_moved = True
+        gui._on_drag_release(None)
+        gui.root.update()
+
+    def test_15_drag_drop_positions(self):
+        """Test that dropped items land exactly above/below/inside the target."""
+        gui = self._create_gui()
+        tree = gui.tree
+        project = tree.get_children()[0]
+        front, side, back = tree.get_children(project)
+        pond, woodland, patio = tree.get_children(back)
+
+        # Forward within the same parent
+        self._drop(gui, front, side, 'below')
+        self.assertEqual(tree.get_children(project), (side, front, back))
+        self._drop(gui, side, back, 'above')
+        self.assertEqual(tree.get_children(project), (front, side, back))
+
+        # Backward within the same parent
+        self._drop(gui, patio, pond, 'above')
+        self.assertEqual(tree.get_children(back), (patio, pond, woodland))
+        self._drop(gui, woodland, patio, 'below')
+        self.assertEqual(tree.get_children(back), (patio, woodland, pond))
+
+        # Across parents
+        self._drop(gui, pond, front, 'below')
+        self.assertEqual(tree.get_children(project), (front, pond, side, back))
+        self.assertEqual(tree.get_children(back), (patio, woodland))
+        self._drop(gui, side, back, 'inside')
+        self.assertEqual(tree.get_children(back), (patio, woodland, side))
+
+        print("✓ Drag-and-drop positions are exact")
+
+    def test_16_closing_windows(self):
+        """Test that the main window only quits the app when it's the last one open."""
+        gui = self._create_gui()
+        gui._new_window()
+        gui.root.update()
+        other = RegenesisGUI._open_windows[-1]
+        self.assertIsNot(other, gui)
+
+        # Closing the main window keeps the root (and the other window) alive
+        gui._close_window()
+        gui.root.update()
+        self.assertEqual(gui.root.state(), 'withdrawn')
+        self.assertTrue(other.root.winfo_viewable(), "Other window should stay open")
+        self.assertIs(gui._focused_window(), other)
+        self.assertNotIn(gui, RegenesisGUI._open_windows)
+        self.assertFalse(gui.root.bind_class(gui._prop_entry_tag),
+                         "Closed window's class bindings should be removed")
+
+        # Closing the last window destroys the root
+        other._close_window()
+        with self.assertRaises(tk.TclError):
+            gui.root.winfo_exists()
+
+        print("✓ App quits only when the last window closes")
+
+    def test_17_batch_updates_restore_tree_packing(self):
+        """Test that bulk tree updates pack the tree back exactly as it was."""
+        gui = self._create_gui()
+        before = gui.tree.pack_info()
+        order = gui.tree.master.pack_slaves()
+
+        with gui._batch_tree_updates():
+            self.assertEqual(gui.tree.winfo_manager(), '')
+
+        self.assertEqual(gui.tree.pack_info(), before)
+        self.assertEqual(gui.tree.master.pack_slaves(), order)
+
+        print("✓ Tree packing restored after bulk updates")
+
 
 def run_integration_tests():
     """Run integration tests with detailed output."""
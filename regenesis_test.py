@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from regenesis import Regenesis
 from plant import Plant
@@ -30,6 +32,18 @@ class TestRegenesis(unittest.TestCase):
         self.assertEqual(len(plants), 9)
         self.assertIsInstance(plants[0], Plant)
 
+    def test_plant_equality_and_hashing(self):
+        """Test that plants compare by value and can be used in sets."""
+        a = Plant("Goldenrod", 3, "yellow")
+        b = Plant("Goldenrod", 3, "yellow")
+        c = Plant("Goldenrod", 2, "yellow")
+
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(a, "Goldenrod")
+        self.assertEqual(len({a, b, c}), 2)
+        self.assertFalse(hasattr(a, '__dict__'))
+
     def test_filter_plants_by_height(self):
         """Test filtering plants by height range."""
         # Filter for plants 2ft or taller
@@ -48,6 +62,35 @@ class TestRegenesis(unittest.TestCase):
             self.assertGreaterEqual(plant.height, 2)
             self.assertLessEqual(plant.height, 3)
 
+    def test_filter_plants_by_height_matches_scan(self):
+        """Test that the height filter agrees with a plain scan for every range."""
+        plants = self.app.get_all_plants()
+        for lo in (None, 1, 2, 3, 4, 5):
+            for hi in (None, 1, 2, 3, 4, 5):
+                expected = [p for p in plants
+                            if (not lo or p.height >= lo) and (not hi or p.height <= hi)]
+                self.assertEqual(self.app.filter_plants_by_height(lo, hi), expected,
+                                 f"Failed for range ({lo}, {hi})")
+
+    def test_container_iterates_over_plants(self):
+        """Test that iterating the container yields the database plants."""
+        container = self.app.plant_container
+        self.assertEqual(list(container), self.app.get_all_plants())
+        self.assertEqual(len(container), 9)
+
+    def test_filter_returns_database_plants(self):
+        """Test that filters return the same Plant objects as the database."""
+        plants = self.app.get_all_plants()
+
+        for plant in self.app.filter_plants_by_height(min_height=1, max_height=4):
+            self.assertTrue(any(plant is p for p in plants))
+
+        for plant in self.app.filter_plants_by_color(plants[0].color):
+            self.assertTrue(any(plant is p for p in plants))
+
+        # A full height range should return every plant
+        self.assertEqual(len(self.app.filter_plants_by_height()), 9)
+
     def test_filter_plants_by_color(self):
         """Test filtering plants by color."""
         colors = ["white", "yellow", "purple", "pink"]
@@ -57,6 +100,39 @@ class TestRegenesis(unittest.TestCase):
             for plant in filtered:
                 self.assertEqual(plant.color, color)
 
+    def test_filters_see_newly_added_plants(self):
+        """Test that cached filter results are refreshed when the database grows."""
+        before = self.app.filter_plants_by_color("blue")
+        self.assertEqual(before, [])
+
+        self.app.plant_container.add_plant("Blue Flag Iris", 2, "blue")
+        after = self.app.filter_plants_by_color("blue")
+        self.assertEqual([p.name for p in after], ["Blue Flag Iris"])
+
+    def test_filter_cache_only_keeps_current_contents(self):
+        """Test that a container drops its cached filter results when it changes."""
+        container = self.app.plant_container
+        self.app.filter_plants_by_color("white")
+        self.app.filter_plants_by_height(1, 2)
+        self.assertEqual(len(container._query_cache), 2)
+
+        container.add_plant("Blue Flag Iris", 2, "blue")
+        self.app.filter_plants_by_color("blue")
+        self.assertEqual(list(container._query_cache), [('color', 'blue')])
+
+    def test_rejected_height_leaves_columns_aligned(self):
+        """Test that a bad height raises without misaligning the container columns."""
+        container = self.app.plant_container
+        container.add_plant("Wild Bergamot", 3.0, "purple")
+        with self.assertRaises(ValueError):
+            container.add_plant("Bad Height", 2.5, "red")
+        with self.assertRaises(ValueError):
+            container.add_plants([Plant("Ok", 1, "red"), Plant("Too Tall", 300, "red")])
+
+        self.assertEqual(len(container.names), len(container.heights))
+        self.assertEqual(len(container.names), len(container.color_codes))
+        self.assertEqual(container.get_all_plants()[-1], Plant("Wild Bergamot", 3, "purple"))
+
     def test_add_plant_to_selection(self):
         """Test adding plants to selection."""
         plants = self.app.get_all_plants()
@@ -93,6 +169,28 @@ class TestRegenesis(unittest.TestCase):
         total = sum(distribution.values())
         self.assertEqual(total, 3)
 
+    def test_save_and_load_round_trip(self):
+        """Test that a saved project restores dimensions and selections."""
+        plants = self.app.get_all_plants()
+        self.app.set_plot_dimensions(10, 15)
+        self.app.add_plant_to_selection(plants[0])
+        self.app.add_plant_to_selection(plants[3])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'project.json')
+            self.app.save_to_file(filepath)
+
+            self.app.new_project()
+            self.assertEqual(len(self.app.selected_plants), 0)
+
+            self.app.load_from_file(filepath)
+
+        self.assertEqual(self.app.plot_width, 10)
+        self.assertEqual(self.app.plot_height, 15)
+        self.assertEqual(len(self.app.selected_plants), 2)
+        self.assertIs(self.app.selected_plants[0], plants[0])
+        self.assertIs(self.app.selected_plants[1], plants[3])
+
 
 if __name__ == '__main__':
     unittest.main()